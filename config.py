@@ -22,6 +22,7 @@ LOG_MAX_BYTES = 10 * 1024 * 1024  # 10MB
 LOG_BACKUP_COUNT = 5
 LOG_STRUCTURED = False  # Enable JSON structured logging
 LOG_PERFORMANCE = True  # Enable performance logging
+LOG_EXC_INFO = True  # Attach tracebacks to errors logged by the logging decorators
 
 # Application configuration
 APP_NAME = "Hệ Thống Quản Lý Vận Tải"
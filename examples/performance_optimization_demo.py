@@ -126,9 +126,8 @@ def demo_memory_management():
     print("\n3. Garbage collection:")
     gc_stats = mem_mgr.gc_manager.collect()
     print(f"   Objects collected: {gc_stats['total_collected']}")
-    print(f"   Gen0: {gc_stats['collected']['gen0']}")
-    print(f"   Gen1: {gc_stats['collected']['gen1']}")
-    print(f"   Gen2: {gc_stats['collected']['gen2']}")
+    print(f"   Full collection: {gc_stats['collected']['all']}")
+    print(f"   Counts before/after: {gc_stats['before_counts']} -> {gc_stats['after_counts']}")
     
     # Memory health check
     print("\n4. Memory health check:")
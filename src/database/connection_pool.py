@@ -47,7 +47,8 @@ class ConnectionPool:
         conn = sqlite3.connect(
             self.database_path,
             check_same_thread=False,
-            timeout=30.0
+            timeout=30.0,
+            cached_statements=256
         )
         
         # Enable foreign keys
@@ -7,7 +7,7 @@ Requirements: 16.1, 16.2, 17.1, 17.3, 17.5
 
 import sqlite3
 import logging
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, Sequence, Tuple, Union
 from pathlib import Path
 from contextlib import contextmanager
 
@@ -18,6 +18,19 @@ from ..utils.error_handler import DatabaseError, ErrorHandler, handle_errors
 
 logger = logging.getLogger(__name__)
 
+_SQL_INSERT_TRIP = """
+    INSERT INTO trips (ma_chuyen, khach_hang, diem_di, diem_den, 
+                     gia_ca, khoan_luong, chi_phi_khac, ghi_chu)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Expression and WHERE clause match idx_trips_code_number (enhanced_schema.sql);
+# INDEXED BY keeps the planner from range-scanning the ma_chuyen index instead
+_SQL_MAX_TRIP_CODE_NUMBER = """
+    SELECT MAX(CAST(SUBSTR(ma_chuyen, 2) AS INTEGER)) AS max_number
+    FROM trips INDEXED BY idx_trips_code_number WHERE ma_chuyen LIKE 'C%'
+"""
+
 
 class EnhancedDatabaseManager:
     """Enhanced database manager with connection pooling and transaction support"""
@@ -73,15 +86,21 @@ class EnhancedDatabaseManager:
             self.pool.return_connection(conn)
     
     @contextmanager
-    def transaction(self):
+    def transaction(self, immediate: bool = False):
         """
         Context manager for database transactions with automatic rollback
         
+        Args:
+            immediate: Take the write lock up front (BEGIN IMMEDIATE), so rows
+                       read inside the transaction cannot change before it commits
+        
         Yields:
             Database connection
         """
         conn = self.pool.get_connection()
         try:
+            if immediate:
+                conn.execute("BEGIN IMMEDIATE")
             yield conn
             conn.commit()
         except Exception as e:
@@ -95,13 +114,13 @@ class EnhancedDatabaseManager:
     # Generic CRUD Operations
     # ========================================================================
     
-    def execute_query(self, query: str, params: tuple = (), use_cache: bool = True) -> List[Dict[str, Any]]:
+    def execute_query(self, query: str, params: Sequence[Any] = (), use_cache: bool = True) -> List[Dict[str, Any]]:
         """
         Execute a SELECT query and return results
         
         Args:
             query: SQL query string
-            params: Query parameters
+            params: Query parameters (any sequence, lists are bound as-is)
             use_cache: Whether to use query result caching
             
         Returns:
@@ -181,24 +200,40 @@ class EnhancedDatabaseManager:
     # Trips Table Operations
     # ========================================================================
     
-    def insert_trip(self, trip_data: Dict[str, Any]) -> int:
-        """Insert a new trip record"""
-        query = """
-            INSERT INTO trips (ma_chuyen, khach_hang, diem_di, diem_den, 
-                             gia_ca, khoan_luong, chi_phi_khac, ghi_chu)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+    def insert_trip(self, trip_data: Union[Dict[str, Any], tuple],
+                    conn: Optional[sqlite3.Connection] = None) -> int:
         """
-        params = (
-            trip_data.get('ma_chuyen'),
-            trip_data.get('khach_hang'),
-            trip_data.get('diem_di', ''),
-            trip_data.get('diem_den', ''),
-            trip_data.get('gia_ca'),
-            trip_data.get('khoan_luong', 0),
-            trip_data.get('chi_phi_khac', 0),
-            trip_data.get('ghi_chu', '')
-        )
-        return self.execute_insert(query, params)
+        Insert a new trip record from a dict or a Trip.to_insert_tuple() tuple
+        
+        Args:
+            trip_data: Trip values
+            conn: Connection of an open transaction() to insert on (optional)
+            
+        Returns:
+            ID of the inserted trip
+        """
+        if isinstance(trip_data, tuple):
+            params = trip_data
+        else:
+            params = (
+                trip_data.get('ma_chuyen'),
+                trip_data.get('khach_hang'),
+                trip_data.get('diem_di', ''),
+                trip_data.get('diem_den', ''),
+                trip_data.get('gia_ca'),
+                trip_data.get('khoan_luong', 0),
+                trip_data.get('chi_phi_khac', 0),
+                trip_data.get('ghi_chu', '')
+            )
+        
+        if conn is None:
+            return self.execute_insert(_SQL_INSERT_TRIP, params)
+        
+        try:
+            return conn.execute(_SQL_INSERT_TRIP, params).lastrowid
+        except sqlite3.Error as e:
+            logger.error(f"Insert execution failed: {e}\nQuery: {_SQL_INSERT_TRIP}")
+            raise DatabaseError(f"Insert failed: {str(e)}", query=_SQL_INSERT_TRIP)
     
     def update_trip(self, trip_id: int, trip_data: Dict[str, Any]) -> int:
         """Update an existing trip record"""
@@ -238,6 +273,23 @@ class EnhancedDatabaseManager:
     
     def search_trips(self, filters: Dict[str, Any]) -> List[Dict[str, Any]]:
         """Search trips with filters"""
+        where_clause, params = self._build_trip_filters(filters)
+        query = f"SELECT * FROM trips WHERE {where_clause} ORDER BY created_at DESC"
+        
+        return self.execute_query(query, tuple(params))
+    
+    def get_trips_after_id(self, filters: Dict[str, Any], last_id: int = 0,
+                           limit: int = 500) -> List[Dict[str, Any]]:
+        """Get the next batch of matching trips with id > last_id (keyset pagination)"""
+        where_clause, params = self._build_trip_filters(filters)
+        query = f"SELECT * FROM trips WHERE {where_clause} AND id > ? ORDER BY id LIMIT ?"
+        params.extend([last_id, limit])
+        
+        # Batches are consumed once while streaming, caching them only evicts useful entries
+        return self.execute_query(query, tuple(params), use_cache=False)
+    
+    def _build_trip_filters(self, filters: Dict[str, Any]) -> Tuple[str, List[Any]]:
+        """Build the WHERE clause and parameters for trip search filters"""
         conditions = []
         params = []
         
@@ -254,27 +306,32 @@ class EnhancedDatabaseManager:
             params.append(f"%{filters['diem_den']}%")
         
         where_clause = " AND ".join(conditions) if conditions else "1=1"
-        query = f"SELECT * FROM trips WHERE {where_clause} ORDER BY created_at DESC"
-        
-        return self.execute_query(query, tuple(params))
+        return where_clause, params
     
     def get_next_trip_code(self) -> str:
         """Generate next trip code (C001, C002, etc.)"""
-        query = "SELECT ma_chuyen FROM trips ORDER BY id DESC LIMIT 1"
-        results = self.execute_query(query)
+        return f"C{self.get_current_max_trip_code_number() + 1:03d}"
+
+    def get_current_max_trip_code_number(self, conn: Optional[sqlite3.Connection] = None) -> int:
+        """
+        Get the numeric suffix of the highest trip code (0 if no trips)
         
-        if not results:
-            return "C001"
+        A single seek on idx_trips_code_number, never served from the result
+        cache since the sequence changes on every insert.
         
-        last_code = results[0]['ma_chuyen']
-        if last_code and last_code.startswith('C'):
-            try:
-                number = int(last_code[1:])
-                return f"C{number + 1:03d}"
-            except ValueError:
-                pass
+        Args:
+            conn: Connection of an open transaction() to read on (optional)
+            
+        Returns:
+            Highest trip code number
+        """
+        if conn is None:
+            results = self.execute_query(_SQL_MAX_TRIP_CODE_NUMBER, use_cache=False)
+            max_number = results[0]['max_number'] if results else None
+        else:
+            max_number = conn.execute(_SQL_MAX_TRIP_CODE_NUMBER).fetchone()[0]
         
-        return "C001"
+        return int(max_number) if max_number is not None else 0
     
     # ========================================================================
     # Company Prices Table Operations
@@ -468,7 +525,9 @@ class EnhancedDatabaseManager:
             WHERE source_department_id = ? AND target_department_id = ? AND is_active = 1
             ORDER BY condition_order
         """
-        return self.execute_query(query, (source_dept_id, target_dept_id))
+        # Callers cache compiled conditions themselves and invalidate on writes,
+        # so always read through to the table here
+        return self.execute_query(query, (source_dept_id, target_dept_id), use_cache=False)
     
     # ========================================================================
     # Workflow History Table Operations
@@ -515,6 +574,26 @@ class EnhancedDatabaseManager:
         
         return self.execute_query(query, tuple(params))
     
+    def get_workflow_status_counts(self, filters: Dict[str, Any] = None) -> Dict[str, int]:
+        """Get workflow history row counts grouped by status"""
+        conditions = []
+        params = []
+        
+        if filters:
+            if 'source_department_id' in filters:
+                conditions.append("source_department_id = ?")
+                params.append(filters['source_department_id'])
+            
+            if 'target_department_id' in filters:
+                conditions.append("target_department_id = ?")
+                params.append(filters['target_department_id'])
+        
+        where_clause = " AND ".join(conditions) if conditions else "1=1"
+        query = f"SELECT status, COUNT(*) AS count FROM workflow_history WHERE {where_clause} GROUP BY status"
+        
+        results = self.execute_query(query, tuple(params), use_cache=False)
+        return {row['status']: row['count'] for row in results}
+    
     # ========================================================================
     # Employee Workspaces Table Operations
     # ========================================================================
@@ -558,6 +637,63 @@ class EnhancedDatabaseManager:
         )
         return self.execute_insert(query, params)
     
+    def insert_pushed_records(
+        self,
+        records_data: List[Dict[str, Any]],
+        history_data: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Insert pushed business records and their workflow history in one transaction
+        
+        Args:
+            records_data: Business record dictionaries (same keys as insert_business_record)
+            history_data: Workflow history dictionaries (same keys as insert_workflow_history)
+            
+        Returns:
+            Number of business records inserted
+        """
+        records_query = """
+            INSERT INTO business_records 
+            (department_id, employee_id, workspace_id, record_data, status)
+            VALUES (?, ?, ?, ?, ?)
+        """
+        history_query = """
+            INSERT INTO workflow_history 
+            (record_id, source_department_id, target_department_id, pushed_by, status, error_message)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """
+        records_params = [
+            (
+                data.get('department_id'),
+                data.get('employee_id'),
+                data.get('workspace_id'),
+                data.get('record_data'),
+                data.get('status', 'active')
+            )
+            for data in records_data
+        ]
+        history_params = [
+            (
+                data.get('record_id'),
+                data.get('source_department_id'),
+                data.get('target_department_id'),
+                data.get('pushed_by'),
+                data.get('status'),
+                data.get('error_message')
+            )
+            for data in history_data
+        ]
+        
+        with self.transaction() as conn:
+            try:
+                cursor = conn.executemany(records_query, records_params)
+                inserted = cursor.rowcount
+                conn.executemany(history_query, history_params)
+                return inserted
+            except sqlite3.Error as e:
+                logger.error(f"Batch push insert failed: {e}")
+                raise DatabaseError(f"Batch push insert failed: {str(e)}", query=records_query)
+    
     def get_business_records(self, dept_id: int, status: str = 'active') -> List[Dict[str, Any]]:
         """Get business records for a department"""
         query = "SELECT * FROM business_records WHERE department_id = ? AND status = ? ORDER BY created_at DESC"
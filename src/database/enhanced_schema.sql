@@ -193,6 +193,8 @@ CREATE INDEX IF NOT EXISTS idx_trips_khach_hang ON trips(khach_hang);
 CREATE INDEX IF NOT EXISTS idx_trips_diem ON trips(diem_di, diem_den);
 CREATE INDEX IF NOT EXISTS idx_trips_created_at ON trips(created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_trips_ma_chuyen ON trips(ma_chuyen);
+-- Numeric trip code sequence: MAX() over this index is a single seek
+CREATE INDEX IF NOT EXISTS idx_trips_code_number ON trips(CAST(SUBSTR(ma_chuyen, 2) AS INTEGER)) WHERE ma_chuyen LIKE 'C%';
 
 -- Company prices indexes
 CREATE INDEX IF NOT EXISTS idx_company_prices_route ON company_prices(company_name, diem_di, diem_den);
@@ -225,6 +227,8 @@ CREATE INDEX IF NOT EXISTS idx_workflow_history_record ON workflow_history(recor
 CREATE INDEX IF NOT EXISTS idx_workflow_history_dept ON workflow_history(source_department_id, target_department_id);
 CREATE INDEX IF NOT EXISTS idx_workflow_history_status ON workflow_history(status);
 CREATE INDEX IF NOT EXISTS idx_workflow_history_created ON workflow_history(created_at DESC);
+-- Covers the department/status filters of the history view and the status counts
+CREATE INDEX IF NOT EXISTS idx_workflow_history_filter ON workflow_history(source_department_id, target_department_id, status, id DESC);
 
 -- Employee workspaces indexes
 CREATE INDEX IF NOT EXISTS idx_workspaces_employee ON employee_workspaces(employee_id);
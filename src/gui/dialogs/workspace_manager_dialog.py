@@ -169,7 +169,7 @@ class WorkspaceManagerDialog(QDialog):
         """Load workspaces from database"""
         try:
             self.workspaces = self.workspace_service.get_workspaces_for_employee(
-                self.employee_id, active_only=False
+                self.employee_id, active_only=False, include_configuration=True
             )
             self.refresh_list()
             
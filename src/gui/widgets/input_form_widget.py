@@ -449,27 +449,32 @@ class InputFormWidget(QWidget):
             db_manager = self.trip_service.db
             target_depts = db_manager.fetch_all(query, (self.department_id,))
             
-            for dept_row in target_depts:
-                target_dept_id = dept_row[0]
-                
-                # Try auto-push if conditions are met
-                success = self.workflow_service.auto_push_if_conditions_met(
-                    record_id=record_id,
-                    record_data=record_data,
-                    source_department_id=self.department_id,
-                    target_department_id=target_dept_id,
-                    pushed_by=None,  # Could be set to current user ID
-                    field_mapping=None  # Could be configured per department
+            # Collect the departments whose conditions are met, then push in one batch
+            # (bulk_push_records retries target by target if the batch fails)
+            records_to_push = [
+                (record_id, record_data, self.department_id, dept_row[0])
+                for dept_row in target_depts
+                if self.workflow_service.check_push_conditions(
+                    record_id,
+                    record_data,
+                    self.department_id,
+                    dept_row[0]
+                )
+            ]
+            
+            pushed = self.workflow_service.bulk_push_records(
+                records_to_push,
+                pushed_by=None,  # Could be set to current user ID
+                field_mapping=None  # Could be configured per department
+            )
+            
+            if pushed:
+                import logging
+                logger = logging.getLogger(__name__)
+                logger.info(
+                    "Auto-pushed record %s from dept %s to %d department(s)",
+                    record_id, self.department_id, pushed
                 )
-                
-                if success:
-                    # Show notification
-                    import logging
-                    logger = logging.getLogger(__name__)
-                    logger.info(
-                        f"Auto-pushed record {record_id} from dept {self.department_id} "
-                        f"to dept {target_dept_id}"
-                    )
                     
         except Exception as e:
             # Log error but don't interrupt user workflow
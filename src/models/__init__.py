@@ -9,7 +9,7 @@ from src.models.field_configuration import FieldConfiguration, FieldType, Widget
 from src.models.formula import Formula
 from src.models.push_condition import PushCondition, ConditionOperator, LogicOperator
 from src.models.workflow_history import WorkflowHistory, WorkflowStatus
-from src.models.employee_workspace import EmployeeWorkspace
+from src.models.employee_workspace import EmployeeWorkspace, WorkspaceExport
 
 __all__ = [
     # Core models
@@ -28,4 +28,5 @@ __all__ = [
     'WorkflowHistory',
     'WorkflowStatus',
     'EmployeeWorkspace',
+    'WorkspaceExport',
 ]
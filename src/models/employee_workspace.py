@@ -6,6 +6,29 @@ from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import json
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+
+def _dumps_json(data: Any) -> str:
+    """Serialize data to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data, ensure_ascii=False)
+
+
+def _loads_json(data: str) -> Any:
+    """
+    Parse a JSON string, using orjson when available
+    
+    orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch the stdlib error.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class EmployeeWorkspace(BaseModel):
     """
@@ -20,7 +43,8 @@ class EmployeeWorkspace(BaseModel):
     Validates:
     - Employee ID is positive
     - Workspace name is not empty
-    - Configuration is valid JSON
+    - Configuration is a dictionary (JSON-serializability is checked when it is
+      serialized for writing)
     """
     model_config = ConfigDict(from_attributes=True)
     
@@ -65,13 +89,27 @@ class EmployeeWorkspace(BaseModel):
         if not isinstance(v, dict):
             raise ValueError("Configuration phải là một dictionary")
         
-        # Try to serialize to ensure it's JSON-serializable
+        return v
+    
+    def serialized_configuration(self) -> Optional[str]:
+        """
+        Get configuration as JSON text for writing to the database
+        
+        Encoded on every call, so in-place changes to configuration are included.
+        
+        Returns:
+            JSON string, or None if configuration is None
+            
+        Raises:
+            ValueError: If configuration is not JSON-serializable
+        """
+        if self.configuration is None:
+            return None
+        
         try:
-            json.dumps(v)
+            return _dumps_json(self.configuration)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Configuration phải có thể serialize thành JSON: {str(e)}")
-        
-        return v
     
     def get_config_value(self, key: str, default: Any = None) -> Any:
         """
@@ -101,3 +139,14 @@ class EmployeeWorkspace(BaseModel):
             self.configuration = {}
         
         self.configuration[key] = value
+
+
+class WorkspaceExport(BaseModel):
+    """
+    Model representing an exported workspace configuration (format version 1.0).
+    """
+    workspace_name: str
+    configuration: Dict[str, Any] = Field(default_factory=dict)
+    is_active: bool = True
+    exported_at: datetime = Field(default_factory=datetime.now)
+    version: str = "1.0"
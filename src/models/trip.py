@@ -2,7 +2,8 @@
 Trip Model - Core model for managing transportation trips
 """
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import ClassVar, Optional, Tuple
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 import re
 
@@ -30,6 +31,12 @@ class Trip(BaseModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
     
+    # Column order of the trips INSERT statement
+    model_fields_for_insert: ClassVar[Tuple[str, ...]] = (
+        'ma_chuyen', 'khach_hang', 'diem_di', 'diem_den',
+        'gia_ca', 'khoan_luong', 'chi_phi_khac', 'ghi_chu'
+    )
+    
     @field_validator('ma_chuyen')
     @classmethod
     def validate_ma_chuyen(cls, v: str) -> str:
@@ -68,3 +75,12 @@ class Trip(BaseModel):
             raise ValueError("Số tiền không được âm")
         
         return v
+    
+    def to_insert_tuple(self) -> Tuple:
+        """
+        Get column values in model_fields_for_insert order, ready to bind to the INSERT
+        """
+        return _insert_values(self)
+
+
+_insert_values = attrgetter(*Trip.model_fields_for_insert)
@@ -352,7 +352,7 @@ class ExcelService:
                 trip_data['ma_chuyen'] = self.db.get_next_trip_code()
             
             trip = Trip(**trip_data)
-            trip_id = self.db.insert_trip(trip.model_dump(exclude={'id', 'created_at', 'updated_at'}))
+            trip_id = self.db.insert_trip(trip.to_insert_tuple())
             
             # Retrieve created trip
             created_trip_data = self.db.get_trip_by_id(trip_id)
@@ -379,7 +379,7 @@ class ExcelService:
             # Create new trip with new code
             trip_data['ma_chuyen'] = self.db.get_next_trip_code()
             trip = Trip(**trip_data)
-            trip_id = self.db.insert_trip(trip.model_dump(exclude={'id', 'created_at', 'updated_at'}))
+            trip_id = self.db.insert_trip(trip.to_insert_tuple())
             
             # Retrieve created trip
             created_trip_data = self.db.get_trip_by_id(trip_id)
@@ -2,7 +2,7 @@
 Push Conditions Service - Service for managing workflow push conditions
 """
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable
 from src.models.push_condition import PushCondition, ConditionOperator, LogicOperator
 from src.database.enhanced_db_manager import EnhancedDatabaseManager
 
@@ -19,8 +19,13 @@ class PushConditionsService:
     - Condition evaluation with 12 operators
     - Support for AND/OR logic operators
     - Validation of conditions
+    - Compilation of conditions into reusable predicates
     """
     
+    # Bumped on every write through any instance, so callers caching
+    # compiled conditions can detect that they are stale
+    version: int = 0
+    
     def __init__(self, db_manager: EnhancedDatabaseManager):
         """
         Initialize push conditions service
@@ -56,6 +61,7 @@ class PushConditionsService:
             }
             
             condition_id = self.db_manager.insert_push_condition(condition_data)
+            self._bump_version()
             logger.info(f"Created push condition {condition_id} from dept {condition.source_department_id} to {condition.target_department_id}")
             
             return condition_id
@@ -136,6 +142,7 @@ class PushConditionsService:
             query = f"UPDATE push_conditions SET {', '.join(set_clauses)} WHERE id = ?"
             
             rows_affected = self.db_manager.execute_update(query, tuple(params))
+            self._bump_version()
             
             if rows_affected > 0:
                 logger.info(f"Updated push condition {condition_id}")
@@ -161,6 +168,7 @@ class PushConditionsService:
         try:
             query = "UPDATE push_conditions SET is_active = 0 WHERE id = ?"
             rows_affected = self.db_manager.execute_update(query, (condition_id,))
+            self._bump_version()
             
             if rows_affected > 0:
                 logger.info(f"Deleted push condition {condition_id}")
@@ -246,6 +254,64 @@ class PushConditionsService:
         logger.info(f"Condition evaluation result: {final_result}")
         return final_result
     
+    def compile_conditions(
+        self, 
+        conditions: List[PushCondition]
+    ) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compile conditions into a predicate over record data
+        
+        The predicate gives the same result as evaluate_conditions, without
+        its grouping and per-condition logging on every call.
+        
+        Args:
+            conditions: List of PushCondition instances
+            
+        Returns:
+            Function taking a record data dictionary and returning True if conditions are met
+        """
+        and_checks = tuple(
+            self._compile_condition(condition)
+            for condition in conditions
+            if condition.logic_operator == LogicOperator.AND
+        )
+        or_checks = tuple(
+            self._compile_condition(condition)
+            for condition in conditions
+            if condition.logic_operator != LogicOperator.AND
+        )
+        
+        if and_checks and or_checks:
+            return lambda data: all(check(data) for check in and_checks) and any(check(data) for check in or_checks)
+        elif and_checks:
+            return lambda data: all(check(data) for check in and_checks)
+        elif or_checks:
+            return lambda data: any(check(data) for check in or_checks)
+        
+        return lambda data: True
+    
+    def _compile_condition(self, condition: PushCondition) -> Callable[[Dict[str, Any]], bool]:
+        """
+        Compile a single condition into a predicate over record data
+        
+        Operator semantics stay in PushCondition.evaluate; only the field
+        lookup is bound here.
+        
+        Args:
+            condition: PushCondition to compile
+            
+        Returns:
+            Function taking a record data dictionary and returning the condition result
+        """
+        field_name = condition.field_name
+        evaluate = condition.evaluate
+        return lambda data: evaluate(data.get(field_name))
+    
+    @staticmethod
+    def _bump_version():
+        """Mark compiled conditions cached by callers as stale"""
+        PushConditionsService.version += 1
+    
     def validate_condition(self, condition: PushCondition) -> List[str]:
         """
         Validate a push condition
@@ -3,11 +3,13 @@ Trip Service - Business logic for managing transportation trips
 Provides CRUD operations, auto-generate trip codes, search, filtering, and pagination
 """
 import logging
-from typing import List, Dict, Optional, Any
+import time
+from typing import List, Dict, Optional, Any, Tuple, Iterator
 from datetime import datetime
 
 from src.database.enhanced_db_manager import EnhancedDatabaseManager
 from src.models.trip import Trip
+from src.utils.error_handler import DatabaseError
 
 
 logger = logging.getLogger(__name__)
@@ -22,16 +24,21 @@ class TripService:
     - Search and filtering by customer, locations
     - Pagination for large datasets
     - Validation using Trip model
+    - Caching of autocomplete lists, invalidated on every write
     """
     
-    def __init__(self, db_manager: EnhancedDatabaseManager):
+    def __init__(self, db_manager: EnhancedDatabaseManager, autocomplete_cache_ttl: int = 60):
         """
         Initialize Trip Service
         
         Args:
             db_manager: Database manager instance
+            autocomplete_cache_ttl: Autocomplete cache time-to-live in seconds (default: 60)
         """
         self.db = db_manager
+        self.autocomplete_cache_ttl = autocomplete_cache_ttl
+        self._cache_version = 0
+        self._autocomplete_cache: Dict[str, Tuple[int, float, List[str]]] = {}
     
     def create_trip(self, trip_data: Dict[str, Any]) -> Trip:
         """
@@ -50,19 +57,32 @@ class TripService:
         """
         try:
             # Auto-generate trip code if not provided
-            if 'ma_chuyen' not in trip_data or not trip_data['ma_chuyen']:
+            code_generated = not trip_data.get('ma_chuyen')
+            if code_generated:
                 trip_data['ma_chuyen'] = self.generate_next_trip_code()
             
             # Validate using Pydantic model
             trip = Trip(**trip_data)
             
             # Insert into database
-            trip_id = self.db.insert_trip(trip.model_dump(exclude={'id', 'created_at', 'updated_at'}))
+            try:
+                trip_id = self.db.insert_trip(trip.to_insert_tuple())
+            except DatabaseError as e:
+                if not code_generated or 'trips.ma_chuyen' not in str(e):
+                    raise
+                # Another writer took the code between lookup and insert, retry once
+                trip_data['ma_chuyen'] = self.generate_next_trip_code()
+                trip = trip.model_copy(update={'ma_chuyen': trip_data['ma_chuyen']})
+                trip_id = self.db.insert_trip(trip.to_insert_tuple())
+            
+            self._cache_version += 1
             
-            # Retrieve and return the created trip
-            created_trip = self.get_trip_by_id(trip_id)
+            # Build the created trip from the validated model instead of re-reading it;
+            # timestamps mirror the UTC CURRENT_TIMESTAMP defaults of the trips table
+            now = datetime.utcnow()
+            created_trip = trip.model_copy(update={'id': trip_id, 'created_at': now, 'updated_at': now})
             
-            logger.info(f"Created trip: {created_trip.ma_chuyen} (ID: {trip_id})")
+            logger.info("Created trip: %s (ID: %s)", created_trip.ma_chuyen, trip_id)
             
             return created_trip
             
@@ -103,11 +123,17 @@ class TripService:
             
             # Update in database
             self.db.update_trip(trip_id, trip.model_dump(exclude={'id', 'ma_chuyen', 'created_at', 'updated_at'}))
+            self._cache_version += 1
             
-            # Retrieve and return the updated trip
-            updated_trip = self.get_trip_by_id(trip_id)
+            # Build the updated trip from the validated model instead of re-reading it;
+            # ma_chuyen is never written by an update, so keep the stored code
+            updated_trip = trip.model_copy(update={
+                'id': trip_id,
+                'ma_chuyen': existing_trip.ma_chuyen,
+                'updated_at': datetime.utcnow()
+            })
             
-            logger.info(f"Updated trip: {updated_trip.ma_chuyen} (ID: {trip_id})")
+            logger.info("Updated trip: %s (ID: %s)", updated_trip.ma_chuyen, trip_id)
             
             return updated_trip
             
@@ -140,9 +166,10 @@ class TripService:
             
             # Delete from database
             rows_affected = self.db.delete_trip(trip_id)
+            self._cache_version += 1
             
             if rows_affected > 0:
-                logger.info(f"Deleted trip: {existing_trip.ma_chuyen} (ID: {trip_id})")
+                logger.info("Deleted trip: %s (ID: %s)", existing_trip.ma_chuyen, trip_id)
                 return True
             
             return False
@@ -168,7 +195,7 @@ class TripService:
             trip_data = self.db.get_trip_by_id(trip_id)
             
             if trip_data:
-                return Trip(**trip_data)
+                return Trip.model_validate(trip_data)
             
             return None
             
@@ -198,7 +225,7 @@ class TripService:
             
             # Get trips from database
             trip_data_list = self.db.get_all_trips(limit=page_size, offset=offset)
-            trips = [Trip(**trip_data) for trip_data in trip_data_list]
+            trips = [Trip.model_validate(trip_data) for trip_data in trip_data_list]
             
             # Get total count
             total = self.get_total_count()
@@ -243,7 +270,7 @@ class TripService:
             trip_data_list = self.db.search_trips(filters)
             
             # Convert to Trip objects
-            all_trips = [Trip(**trip_data) for trip_data in trip_data_list]
+            all_trips = [Trip.model_validate(trip_data) for trip_data in trip_data_list]
             
             # Apply pagination
             total = len(all_trips)
@@ -253,7 +280,7 @@ class TripService:
             
             total_pages = (total + page_size - 1) // page_size if total > 0 else 1
             
-            logger.info(f"Search found {total} trips matching filters: {filters}")
+            logger.info("Search found %s trips matching filters: %s", total, filters)
             
             return {
                 'trips': paginated_trips,
@@ -268,10 +295,42 @@ class TripService:
             logger.error(f"Error searching trips: {e}")
             raise
     
+    def iter_trips(self, filters: Optional[Dict[str, Any]] = None, batch_size: int = 500) -> Iterator[Trip]:
+        """
+        Stream trips matching filters in id order without loading them all at once
+        
+        Intended for exports and bulk processing; the UI should keep using the
+        paged get_all_trips/search_trips.
+        
+        Args:
+            filters: Same filter criteria as search_trips (default: all trips)
+            batch_size: Number of rows fetched per query
+        
+        Yields:
+            Trip objects
+        """
+        filters = filters or {}
+        last_id = 0
+        
+        while True:
+            batch = self.db.get_trips_after_id(filters, last_id=last_id, limit=batch_size)
+            if not batch:
+                return
+            
+            for trip_data in batch:
+                yield Trip.model_validate(trip_data)
+            
+            if len(batch) < batch_size:
+                return
+            last_id = batch[-1]['id']
+    
     def generate_next_trip_code(self) -> str:
         """
         Generate the next trip code in sequence (C001, C002, ...)
         
+        The sequence is read from the database on every call, so codes taken by
+        other writers (Excel import, other services) are never reused.
+        
         Returns:
             Next trip code string
         """
@@ -304,9 +363,7 @@ class TripService:
             List of unique customer names
         """
         try:
-            query = "SELECT DISTINCT khach_hang FROM trips WHERE khach_hang IS NOT NULL AND khach_hang != '' ORDER BY khach_hang"
-            results = self.db.execute_query(query)
-            return [row['khach_hang'] for row in results]
+            return self._get_distinct_values('khach_hang')
         except Exception as e:
             logger.error(f"Error getting unique customers: {e}")
             raise
@@ -322,23 +379,100 @@ class TripService:
             Dictionary with 'diem_di' and/or 'diem_den' lists
         """
         try:
+            if location_type == 'both':
+                return self._get_both_locations()
+            
             result = {}
             
-            if location_type in ['diem_di', 'both']:
-                query = "SELECT DISTINCT diem_di FROM trips WHERE diem_di IS NOT NULL AND diem_di != '' ORDER BY diem_di"
-                results = self.db.execute_query(query)
-                result['diem_di'] = [row['diem_di'] for row in results]
+            if location_type == 'diem_di':
+                result['diem_di'] = self._get_distinct_values('diem_di')
             
-            if location_type in ['diem_den', 'both']:
-                query = "SELECT DISTINCT diem_den FROM trips WHERE diem_den IS NOT NULL AND diem_den != '' ORDER BY diem_den"
-                results = self.db.execute_query(query)
-                result['diem_den'] = [row['diem_den'] for row in results]
+            if location_type == 'diem_den':
+                result['diem_den'] = self._get_distinct_values('diem_den')
             
             return result
         except Exception as e:
             logger.error(f"Error getting unique locations: {e}")
             raise
     
+    def _get_both_locations(self) -> Dict[str, List[str]]:
+        """
+        Get departure and destination autocomplete lists with a single query
+        
+        Returns:
+            Dictionary with 'diem_di' and 'diem_den' lists
+        """
+        cached_di = self._get_cached_autocomplete('diem_di')
+        cached_den = self._get_cached_autocomplete('diem_den')
+        if cached_di is not None or cached_den is not None:
+            # At most one list is missing, a single-column query covers it
+            return {
+                'diem_di': cached_di if cached_di is not None else self._get_distinct_values('diem_di'),
+                'diem_den': cached_den if cached_den is not None else self._get_distinct_values('diem_den')
+            }
+        
+        query = """
+            SELECT 'diem_di' AS kind, diem_di AS value FROM trips WHERE diem_di IS NOT NULL AND diem_di != ''
+            UNION
+            SELECT 'diem_den' AS kind, diem_den AS value FROM trips WHERE diem_den IS NOT NULL AND diem_den != ''
+            ORDER BY kind, value
+        """
+        results = self.db.execute_query(query, use_cache=False)
+        
+        result = {'diem_di': [], 'diem_den': []}
+        for row in results:
+            result[row['kind']].append(row['value'])
+        
+        now = time.monotonic()
+        for column, values in result.items():
+            self._autocomplete_cache[column] = (self._cache_version, now, values)
+        
+        return result
+    
+    def _get_distinct_values(self, column: str) -> List[str]:
+        """
+        Get sorted distinct non-empty values of a trips column, using the autocomplete cache
+        
+        Args:
+            column: Column name ('khach_hang', 'diem_di' or 'diem_den')
+        
+        Returns:
+            List of distinct values
+        """
+        cached = self._get_cached_autocomplete(column)
+        if cached is not None:
+            return cached
+        
+        query = f"SELECT DISTINCT {column} FROM trips WHERE {column} IS NOT NULL AND {column} != '' ORDER BY {column}"
+        results = self.db.execute_query(query, use_cache=False)
+        values = [row[column] for row in results]
+        
+        self._autocomplete_cache[column] = (self._cache_version, time.monotonic(), values)
+        return values
+    
+    def _get_cached_autocomplete(self, cache_key: str) -> Optional[List[str]]:
+        """
+        Get cached autocomplete values if still valid (same write version and not expired)
+        
+        Args:
+            cache_key: Cache key to check
+        
+        Returns:
+            Cached values, or None if missing or stale
+        """
+        entry = self._autocomplete_cache.get(cache_key)
+        if entry is None:
+            return None
+        
+        version, timestamp, values = entry
+        if version != self._cache_version:
+            return None
+        
+        if time.monotonic() - timestamp >= self.autocomplete_cache_ttl:
+            return None
+        
+        return values
+    
     def bulk_create_trips(self, trips_data: List[Dict[str, Any]]) -> List[Trip]:
         """
         Create multiple trips in a single transaction
@@ -353,14 +487,34 @@ class TripService:
             ValueError: If any validation fails
             Exception: If database operation fails
         """
-        created_trips = []
+        inserted = []
         
         try:
-            for trip_data in trips_data:
-                trip = self.create_trip(trip_data)
-                created_trips.append(trip)
-            
-            logger.info(f"Bulk created {len(created_trips)} trips")
+            # The write lock is held from the code lookup to the commit, so the
+            # sequence is read once and no other writer can take these codes
+            with self.db.transaction(immediate=True) as conn:
+                next_number = None
+                for trip_data in trips_data:
+                    if not trip_data.get('ma_chuyen'):
+                        if next_number is None:
+                            next_number = self.db.get_current_max_trip_code_number(conn)
+                        next_number += 1
+                        trip_data['ma_chuyen'] = f"C{next_number:03d}"
+                    
+                    trip = Trip(**trip_data)
+                    trip_id = self.db.insert_trip(trip.to_insert_tuple(), conn=conn)
+                    inserted.append((trip, trip_id))
+            
+            self._cache_version += 1
+            
+            # Timestamps mirror the UTC CURRENT_TIMESTAMP defaults, as in create_trip
+            now = datetime.utcnow()
+            created_trips = [
+                trip.model_copy(update={'id': trip_id, 'created_at': now, 'updated_at': now})
+                for trip, trip_id in inserted
+            ]
+            
+            logger.info("Bulk created %s trips", len(created_trips))
             
             return created_trips
             
@@ -3,7 +3,7 @@ Workflow Service - Service for executing workflow automation
 """
 import logging
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Callable
 from datetime import datetime
 from src.models.workflow_history import WorkflowHistory, WorkflowStatus
 from src.models.push_condition import PushCondition
@@ -11,9 +11,22 @@ from src.database.enhanced_db_manager import EnhancedDatabaseManager
 from src.services.push_conditions_service import PushConditionsService
 
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
+
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_record_data(data: Dict[str, Any]) -> str:
+    """Serialize pushed record data to a JSON string, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(data)
+
+
 class WorkflowService:
     """
     Service for executing workflow automation.
@@ -34,6 +47,10 @@ class WorkflowService:
         """
         self.db_manager = db_manager
         self.push_conditions_service = PushConditionsService(db_manager)
+        
+        # Compiled push conditions per (source, target), tagged with the
+        # PushConditionsService version they were compiled at
+        self._condition_cache: Dict[Tuple[int, int], Tuple[int, Optional[Callable[[Dict[str, Any]], bool]]]] = {}
     
     def push_record(
         self,
@@ -71,7 +88,7 @@ class WorkflowService:
                 'department_id': target_department_id,
                 'employee_id': pushed_by if pushed_by else 1,  # Use employee ID 1 as default
                 'workspace_id': None,
-                'record_data': json.dumps(transformed_data),
+                'record_data': _dumps_record_data(transformed_data),
                 'status': 'active'
             }
             
@@ -88,8 +105,8 @@ class WorkflowService:
             )
             
             logger.info(
-                f"Successfully pushed record {record_id} from dept {source_department_id} "
-                f"to dept {target_department_id} (new record id: {new_record_id})"
+                "Successfully pushed record %s from dept %s to dept %s (new record id: %s)",
+                record_id, source_department_id, target_department_id, new_record_id
             )
             
             return True
@@ -134,30 +151,12 @@ class WorkflowService:
             True if conditions met and push successful, False otherwise
         """
         try:
-            # Get push conditions
-            conditions = self.push_conditions_service.get_push_conditions(
+            if not self.check_push_conditions(
+                record_id,
+                record_data,
                 source_department_id,
                 target_department_id
-            )
-            
-            if not conditions:
-                logger.debug(
-                    f"No push conditions defined from dept {source_department_id} "
-                    f"to dept {target_department_id}"
-                )
-                return False
-            
-            # Evaluate conditions
-            conditions_met = self.push_conditions_service.evaluate_conditions(
-                conditions,
-                record_data
-            )
-            
-            if not conditions_met:
-                logger.debug(
-                    f"Push conditions not met for record {record_id} "
-                    f"from dept {source_department_id} to dept {target_department_id}"
-                )
+            ):
                 return False
             
             # Push record
@@ -174,6 +173,151 @@ class WorkflowService:
             logger.error(f"Failed to auto-push record {record_id}: {e}")
             return False
     
+    def check_push_conditions(
+        self,
+        record_id: int,
+        record_data: Dict[str, Any],
+        source_department_id: int,
+        target_department_id: int
+    ) -> bool:
+        """
+        Check whether a record satisfies the push conditions between two departments
+        
+        Args:
+            record_id: ID of the record (used for logging)
+            record_data: Dictionary of record field values
+            source_department_id: Source department ID
+            target_department_id: Target department ID
+            
+        Returns:
+            True if conditions exist and are met, False otherwise
+        """
+        # Pairs without conditions are cached as a None predicate
+        predicate = self._get_condition_predicate(source_department_id, target_department_id)
+        
+        if predicate is None:
+            logger.debug(
+                "No push conditions defined from dept %s to dept %s",
+                source_department_id, target_department_id
+            )
+            return False
+        
+        conditions_met = predicate(record_data)
+        
+        if not conditions_met:
+            logger.debug(
+                "Push conditions not met for record %s from dept %s to dept %s",
+                record_id, source_department_id, target_department_id
+            )
+        
+        return conditions_met
+    
+    def _get_condition_predicate(
+        self,
+        source_department_id: int,
+        target_department_id: int
+    ) -> Optional[Callable[[Dict[str, Any]], bool]]:
+        """
+        Get the compiled push conditions between two departments, compiling on a cache miss
+        
+        Args:
+            source_department_id: Source department ID
+            target_department_id: Target department ID
+            
+        Returns:
+            Predicate over record data, or None if no conditions are defined
+        """
+        key = (source_department_id, target_department_id)
+        version = PushConditionsService.version
+        
+        cached = self._condition_cache.get(key)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+        
+        conditions = self.push_conditions_service.get_push_conditions(
+            source_department_id,
+            target_department_id
+        )
+        predicate = self.push_conditions_service.compile_conditions(conditions) if conditions else None
+        
+        self._condition_cache[key] = (version, predicate)
+        return predicate
+    
+    def bulk_push_records(
+        self,
+        records: List[Tuple[int, Dict[str, Any], int, int]],
+        pushed_by: Optional[int] = None,
+        field_mapping: Optional[Dict[str, str]] = None
+    ) -> int:
+        """
+        Push many records at once with two batched inserts in a single transaction
+        
+        If the batch fails it is rolled back and each record is pushed on its own
+        with push_record, so one bad target does not block the others.
+        
+        Args:
+            records: List of (record_id, record_data, source_department_id, target_department_id)
+            pushed_by: Employee ID who initiated the push (optional)
+            field_mapping: Dictionary mapping source fields to target fields (optional)
+            
+        Returns:
+            Number of records pushed
+        """
+        if not records:
+            return 0
+        
+        try:
+            business_records_data = [
+                {
+                    'department_id': target_department_id,
+                    'employee_id': pushed_by if pushed_by else 1,  # Use employee ID 1 as default
+                    'workspace_id': None,
+                    'record_data': _dumps_record_data(
+                        self.transform_data(record_data, field_mapping)
+                        if field_mapping else record_data
+                    ),
+                    'status': 'active'
+                }
+                for _, record_data, _, target_department_id in records
+            ]
+            history_data = [
+                {
+                    'record_id': record_id,
+                    'source_department_id': source_department_id,
+                    'target_department_id': target_department_id,
+                    'pushed_by': pushed_by,
+                    'status': WorkflowStatus.SUCCESS.value,
+                    'error_message': None
+                }
+                for record_id, _, source_department_id, target_department_id in records
+            ]
+            
+            pushed = self.db_manager.insert_pushed_records(business_records_data, history_data)
+            
+            logger.info("Bulk pushed %s records", pushed)
+            
+            return pushed
+            
+        except Exception as e:
+            logger.warning(
+                "Bulk push of %d records failed, pushing one by one: %s",
+                len(records), e
+            )
+            
+            # The whole batch was rolled back; push_record logs each outcome
+            return sum(
+                1
+                for record_id, record_data, source_department_id, target_department_id in records
+                if self.push_record(
+                    record_id,
+                    record_data,
+                    source_department_id,
+                    target_department_id,
+                    pushed_by=pushed_by,
+                    field_mapping=field_mapping
+                )
+            )
+    
     def transform_data(
         self,
         source_data: Dict[str, Any],
@@ -192,19 +336,26 @@ class WorkflowService:
         Returns:
             Transformed data dictionary
         """
-        transformed_data = {}
+        # Unmapped fields pass through as-is; mapped values are applied last
+        # so they win over an unmapped field with the same name
+        transformed_data = {
+            field: value
+            for field, value in source_data.items()
+            if field not in field_mapping
+        }
+        transformed_data.update({
+            target_field: source_data[source_field]
+            for source_field, target_field in field_mapping.items()
+            if source_field in source_data
+        })
         
-        for source_field, target_field in field_mapping.items():
-            if source_field in source_data:
-                transformed_data[target_field] = source_data[source_field]
-                logger.debug(f"Mapped {source_field} -> {target_field}: {source_data[source_field]}")
-            else:
-                logger.warning(f"Source field {source_field} not found in data")
+        for source_field in field_mapping.keys() - source_data.keys():
+            logger.warning("Source field %s not found in data", source_field)
         
-        # Include unmapped fields as-is
-        for field, value in source_data.items():
-            if field not in field_mapping and field not in transformed_data:
-                transformed_data[field] = value
+        if logger.isEnabledFor(logging.DEBUG):
+            for source_field, target_field in field_mapping.items():
+                if source_field in source_data:
+                    logger.debug("Mapped %s -> %s: %s", source_field, target_field, source_data[source_field])
         
         return transformed_data
     
@@ -253,8 +404,8 @@ class WorkflowService:
             history_id = self.db_manager.insert_workflow_history(history_data)
             
             logger.info(
-                f"Logged workflow history {history_id}: record {record_id} "
-                f"from dept {source_department_id} to dept {target_department_id} - {status}"
+                "Logged workflow history %s: record %s from dept %s to dept %s - %s",
+                history_id, record_id, source_department_id, target_department_id, status
             )
             
             return history_id
@@ -302,11 +453,11 @@ class WorkflowService:
             history_data = self.db_manager.get_workflow_history(filters, limit)
             
             history_list = [
-                WorkflowHistory(**data)
+                WorkflowHistory.model_validate(data)
                 for data in history_data
             ]
             
-            logger.debug(f"Retrieved {len(history_list)} workflow history records")
+            logger.debug("Retrieved %s workflow history records", len(history_list))
             
             return history_list
             
@@ -342,22 +493,12 @@ class WorkflowService:
             if target_department_id is not None:
                 filters['target_department_id'] = target_department_id
             
-            # Get all history records
-            history_list = self.get_workflow_history(
-                source_department_id=source_department_id,
-                target_department_id=target_department_id,
-                limit=10000  # Get all records
-            )
+            # Aggregate in SQL instead of loading every history row
+            counts = self.db_manager.get_workflow_status_counts(filters)
             
-            total_pushes = len(history_list)
-            successful_pushes = sum(
-                1 for h in history_list 
-                if h.status == WorkflowStatus.SUCCESS
-            )
-            failed_pushes = sum(
-                1 for h in history_list 
-                if h.status == WorkflowStatus.FAILED
-            )
+            total_pushes = sum(counts.values())
+            successful_pushes = counts.get(WorkflowStatus.SUCCESS.value, 0)
+            failed_pushes = counts.get(WorkflowStatus.FAILED.value, 0)
             
             success_rate = (
                 (successful_pushes / total_pushes * 100) 
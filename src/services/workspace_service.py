@@ -5,15 +5,80 @@ Provides workspace CRUD, switching, configuration export/import, and data isolat
 
 import json
 import logging
-from typing import List, Dict, Optional, Any
-from datetime import datetime
+import sqlite3
+import threading
+from collections import defaultdict
+from typing import List, Dict, Iterator, Optional, Any, Sequence, Set, Tuple, Union
 
-from src.models.employee_workspace import EmployeeWorkspace
+from src.models.employee_workspace import EmployeeWorkspace, WorkspaceExport, _dumps_json, _loads_json
 from src.database.enhanced_db_manager import EnhancedDatabaseManager
+from src.utils.error_handler import DatabaseError
+from src.utils.performance_optimizer import LRUCache
 
 
 logger = logging.getLogger(__name__)
 
+# ============================================================================
+# SQL statements
+# ============================================================================
+
+_SQL_INSERT_WORKSPACE = """
+    INSERT INTO employee_workspaces (employee_id, workspace_name, is_active, configuration)
+    VALUES (?, ?, ?, ?)
+"""
+
+_SQL_SELECT_WORKSPACE_BY_ID = "SELECT * FROM employee_workspaces WHERE id = ?"
+
+_SQL_SELECT_WORKSPACE_BY_NAME = "SELECT * FROM employee_workspaces WHERE employee_id = ? AND workspace_name = ?"
+
+_SQL_SELECT_WORKSPACE_OWNER = "SELECT employee_id, is_active FROM employee_workspaces WHERE id = ?"
+
+_SQL_UPDATE_WORKSPACE_FIELDS = """
+    UPDATE employee_workspaces 
+    SET workspace_name = COALESCE(?, workspace_name),
+        configuration = COALESCE(?, configuration),
+        is_active = COALESCE(?, is_active)
+    WHERE id = ?
+"""
+
+_SQL_DELETE_WORKSPACE = "DELETE FROM employee_workspaces WHERE id = ?"
+
+_SQL_INSERT_RECORD = """
+    INSERT INTO business_records 
+    (department_id, employee_id, workspace_id, record_data, status)
+    VALUES (?, ?, ?, ?, ?)
+"""
+
+_SQL_RECORD_STATS = """
+    SELECT SUM(status = 'active') AS active,
+           SUM(status = 'archived') AS archived,
+           SUM(status = 'deleted') AS deleted,
+           COUNT(*) AS total
+    FROM business_records WHERE workspace_id = ?
+"""
+
+# Columns needed to list workspaces; configuration JSON is only loaded on request
+_WORKSPACE_LIST_COLUMNS = "id, employee_id, workspace_name, is_active"
+
+# Workspace list queries keyed by (include_configuration, active_only)
+_SQL_LIST_WORKSPACES = {
+    (include_configuration, active_only): (
+        f"SELECT {_WORKSPACE_LIST_COLUMNS}"
+        f"{', configuration, created_at' if include_configuration else ''} "
+        f"FROM employee_workspaces WHERE employee_id = ?"
+        f"{' AND is_active = 1' if active_only else ''} "
+        f"ORDER BY workspace_name"
+    )
+    for include_configuration in (False, True)
+    for active_only in (False, True)
+}
+
+# Columns callers may project from business_records
+_RECORD_COLUMNS = frozenset({
+    'id', 'department_id', 'employee_id', 'workspace_id',
+    'record_data', 'status', 'created_at', 'updated_at'
+})
+
 
 class WorkspaceService:
     """
@@ -24,19 +89,27 @@ class WorkspaceService:
     - Switch between workspaces
     - Export/import workspace configurations
     - Data isolation between workspaces
+    - Short-lived cache of workspace rows, invalidated on every write
     
     Validates: Requirements 9.1, 9.2, 9.3, 9.4, 9.5
     """
     
-    def __init__(self, db_manager: EnhancedDatabaseManager):
+    def __init__(self, db_manager: EnhancedDatabaseManager, cache_ttl: int = 60):
         """
         Initialize workspace service
         
         Args:
             db_manager: Database manager instance
+            cache_ttl: Workspace cache time-to-live in seconds (default: 60)
         """
         self.db = db_manager
-        self._active_workspaces: Dict[int, int] = {}  # employee_id -> workspace_id
+        self._active_workspaces: Dict[int, EmployeeWorkspace] = {}  # employee_id -> workspace
+        self._ws_to_emps: Dict[int, Set[int]] = defaultdict(set)  # workspace_id -> employee_ids
+        self._active_workspaces_lock = threading.Lock()
+        # Keys: ('id', workspace_id), ('name', employee_id, name),
+        # ('employee', employee_id, include_configuration) for active workspace lists;
+        # values are database rows, models are built per lookup
+        self._ws_cache = LRUCache(max_size=512, ttl=cache_ttl)
     
     # ========================================================================
     # Workspace CRUD Operations
@@ -46,7 +119,8 @@ class WorkspaceService:
         self,
         employee_id: int,
         workspace_name: str,
-        configuration: Optional[Dict[str, Any]] = None
+        configuration: Optional[Dict[str, Any]] = None,
+        is_active: bool = True
     ) -> EmployeeWorkspace:
         """
         Create a new workspace for an employee
@@ -55,6 +129,7 @@ class WorkspaceService:
             employee_id: Employee ID
             workspace_name: Name of the workspace
             configuration: Optional workspace configuration
+            is_active: Whether the workspace is created active
             
         Returns:
             Created workspace
@@ -68,16 +143,12 @@ class WorkspaceService:
         workspace = EmployeeWorkspace(
             employee_id=employee_id,
             workspace_name=workspace_name,
+            is_active=is_active,
             configuration=configuration or {}
         )
         
-        # Check if workspace name already exists for this employee
-        existing = self.get_workspace_by_name(employee_id, workspace_name)
-        if existing:
-            raise ValueError(f"Workspace '{workspace_name}' đã tồn tại cho nhân viên này")
-        
         # Serialize configuration to JSON string for database
-        config_json = json.dumps(workspace.configuration) if workspace.configuration else None
+        config_json = workspace.serialized_configuration() if workspace.configuration else None
         
         # Insert into database
         workspace_data = {
@@ -87,20 +158,24 @@ class WorkspaceService:
             'configuration': config_json
         }
         
-        workspace_id = self.db.execute_insert(
-            """
-            INSERT INTO employee_workspaces (employee_id, workspace_name, is_active, configuration)
-            VALUES (?, ?, ?, ?)
-            """,
-            (
-                workspace_data['employee_id'],
-                workspace_data['workspace_name'],
-                workspace_data['is_active'],
-                workspace_data['configuration']
+        # UNIQUE(employee_id, workspace_name) rejects duplicates, no pre-check query needed
+        try:
+            workspace_id = self.db.execute_insert(
+                _SQL_INSERT_WORKSPACE,
+                (
+                    workspace_data['employee_id'],
+                    workspace_data['workspace_name'],
+                    workspace_data['is_active'],
+                    workspace_data['configuration']
+                )
             )
-        )
+        except DatabaseError as e:
+            if self._is_name_conflict(e):
+                raise ValueError(f"Workspace '{workspace_name}' đã tồn tại cho nhân viên này") from e
+            raise
         
         workspace.id = workspace_id
+        self._invalidate_employee_lists(employee_id)
         
         logger.info(f"Created workspace '{workspace_name}' (ID: {workspace_id}) for employee {employee_id}")
         
@@ -116,15 +191,21 @@ class WorkspaceService:
         Returns:
             Workspace or None if not found
         """
-        results = self.db.execute_query(
-            "SELECT * FROM employee_workspaces WHERE id = ?",
-            (workspace_id,)
-        )
-        
-        if not results:
-            return None
+        row = self._ws_cache.get(('id', workspace_id))
+        if row is None:
+            results = self.db.execute_query(
+                _SQL_SELECT_WORKSPACE_BY_ID,
+                (workspace_id,),
+                use_cache=False
+            )
+            
+            if not results:
+                return None
+            
+            row = results[0]
+            self._cache_row(row)
         
-        return self._row_to_workspace(results[0])
+        return self._row_to_workspace(row)
     
     def get_workspace_by_name(
         self,
@@ -141,20 +222,27 @@ class WorkspaceService:
         Returns:
             Workspace or None if not found
         """
-        results = self.db.execute_query(
-            "SELECT * FROM employee_workspaces WHERE employee_id = ? AND workspace_name = ?",
-            (employee_id, workspace_name)
-        )
-        
-        if not results:
-            return None
+        row = self._ws_cache.get(('name', employee_id, workspace_name))
+        if row is None:
+            results = self.db.execute_query(
+                _SQL_SELECT_WORKSPACE_BY_NAME,
+                (employee_id, workspace_name),
+                use_cache=False
+            )
+            
+            if not results:
+                return None
+            
+            row = results[0]
+            self._cache_row(row)
         
-        return self._row_to_workspace(results[0])
+        return self._row_to_workspace(row)
     
     def get_workspaces_for_employee(
         self,
         employee_id: int,
-        active_only: bool = True
+        active_only: bool = True,
+        include_configuration: bool = False
     ) -> List[EmployeeWorkspace]:
         """
         Get all workspaces for an employee
@@ -162,23 +250,26 @@ class WorkspaceService:
         Args:
             employee_id: Employee ID
             active_only: Only return active workspaces
+            include_configuration: Also load configuration and created_at
+                                   (configuration is None otherwise)
             
         Returns:
             List of workspaces
             
         Validates: Requirement 9.2
         """
-        query = "SELECT * FROM employee_workspaces WHERE employee_id = ?"
-        params = [employee_id]
-        
-        if active_only:
-            query += " AND is_active = 1"
-        
-        query += " ORDER BY workspace_name"
-        
-        results = self.db.execute_query(query, tuple(params))
+        cache_key = ('employee', employee_id, include_configuration)
+        rows = self._ws_cache.get(cache_key) if active_only else None
+        if rows is None:
+            rows = self.db.execute_query(
+                _SQL_LIST_WORKSPACES[(include_configuration, active_only)],
+                (employee_id,),
+                use_cache=False
+            )
+            if active_only:
+                self._ws_cache.set(cache_key, tuple(rows))
         
-        return [self._row_to_workspace(row) for row in results]
+        return [self._row_to_workspace(row) for row in rows]
     
     def update_workspace(
         self,
@@ -202,41 +293,70 @@ class WorkspaceService:
         Raises:
             ValueError: If workspace not found or name already exists
         """
-        # Get existing workspace
+        # Get existing workspace (usually cached by the lookup that found its ID)
         workspace = self.get_workspace_by_id(workspace_id)
         if not workspace:
             raise ValueError(f"Workspace ID {workspace_id} không tồn tại")
         
-        # Update fields
-        if workspace_name is not None:
-            # Check if new name conflicts with existing workspace
-            existing = self.get_workspace_by_name(workspace.employee_id, workspace_name)
-            if existing and existing.id != workspace_id:
-                raise ValueError(f"Workspace '{workspace_name}' đã tồn tại cho nhân viên này")
-            workspace.workspace_name = workspace_name
-        
-        if configuration is not None:
-            workspace.configuration = configuration
-        
-        if is_active is not None:
-            workspace.is_active = is_active
-        
-        # Serialize configuration
-        config_json = json.dumps(workspace.configuration) if workspace.configuration else None
-        
-        # Update database
-        self.db.execute_update(
-            """
-            UPDATE employee_workspaces 
-            SET workspace_name = ?, configuration = ?, is_active = ?
-            WHERE id = ?
-            """,
-            (workspace.workspace_name, config_json, workspace.is_active, workspace_id)
-        )
+        changes = {
+            field: value
+            for field, value in (
+                ('workspace_name', workspace_name),
+                ('configuration', configuration),
+                ('is_active', is_active)
+            )
+            if value is not None
+        }
+        updated = workspace.model_copy(update=changes)
+        
+        # A name already used by another workspace fails the UNIQUE constraint
+        try:
+            self._update_workspace_fields(
+                workspace_id,
+                workspace_name=workspace_name,
+                config_json=updated.serialized_configuration() if configuration is not None else None,
+                is_active=is_active
+            )
+        except DatabaseError as e:
+            if self._is_name_conflict(e):
+                raise ValueError(f"Workspace '{workspace_name}' đã tồn tại cho nhân viên này") from e
+            raise
+        
+        self._invalidate_workspace(workspace)
+        
+        # Keep the employee's active workspace in sync with the new values
+        with self._active_workspaces_lock:
+            active = self._active_workspaces.get(updated.employee_id)
+            if active is not None and active.id == workspace_id:
+                self._active_workspaces[updated.employee_id] = updated.model_copy(deep=True)
         
         logger.info(f"Updated workspace ID {workspace_id}")
         
-        return workspace
+        return updated
+    
+    def _update_workspace_fields(
+        self,
+        workspace_id: int,
+        workspace_name: Optional[str] = None,
+        config_json: Optional[str] = None,
+        is_active: Optional[bool] = None
+    ) -> int:
+        """
+        Write only the given workspace columns, None leaves a column unchanged
+        
+        Args:
+            workspace_id: Workspace ID
+            workspace_name: New workspace name
+            config_json: New configuration, already serialized
+            is_active: New active status
+            
+        Returns:
+            Number of rows updated
+        """
+        return self.db.execute_update(
+            _SQL_UPDATE_WORKSPACE_FIELDS,
+            (workspace_name, config_json, is_active, workspace_id)
+        )
     
     def delete_workspace(self, workspace_id: int) -> bool:
         """
@@ -248,16 +368,18 @@ class WorkspaceService:
         Returns:
             True if deleted, False if not found
         """
-        rows_affected = self.db.execute_update(
-            "DELETE FROM employee_workspaces WHERE id = ?",
-            (workspace_id,)
-        )
+        workspace = self.get_workspace_by_id(workspace_id)
+        
+        rows_affected = self.db.execute_update(_SQL_DELETE_WORKSPACE, (workspace_id,))
+        
+        if workspace:
+            self._invalidate_workspace(workspace)
         
         if rows_affected > 0:
             # Remove from active workspaces if it was active
-            for emp_id, ws_id in list(self._active_workspaces.items()):
-                if ws_id == workspace_id:
-                    del self._active_workspaces[emp_id]
+            with self._active_workspaces_lock:
+                for emp_id in self._ws_to_emps.pop(workspace_id, ()):
+                    self._active_workspaces.pop(emp_id, None)
             
             logger.info(f"Deleted workspace ID {workspace_id}")
             return True
@@ -280,23 +402,30 @@ class WorkspaceService:
             The activated workspace
             
         Raises:
-            ValueError: If workspace not found or doesn't belong to employee
+            ValueError: If workspace not found, doesn't belong to employee or is inactive
             
         Validates: Requirement 9.3
         """
-        # Verify workspace exists and belongs to employee
+        # Verify workspace exists, belongs to employee and is active
+        if not self._verify_ownership(workspace_id, employee_id):
+            raise ValueError(f"Workspace ID {workspace_id} không hoạt động")
+        
         workspace = self.get_workspace_by_id(workspace_id)
         if not workspace:
             raise ValueError(f"Workspace ID {workspace_id} không tồn tại")
         
-        if workspace.employee_id != employee_id:
-            raise ValueError(f"Workspace ID {workspace_id} không thuộc về nhân viên {employee_id}")
-        
-        if not workspace.is_active:
-            raise ValueError(f"Workspace '{workspace.workspace_name}' không hoạt động")
-        
         # Set as active workspace for this employee
-        self._active_workspaces[employee_id] = workspace_id
+        with self._active_workspaces_lock:
+            previous = self._active_workspaces.get(employee_id)
+            if previous is not None and previous.id != workspace_id:
+                employees = self._ws_to_emps.get(previous.id)
+                if employees is not None:
+                    employees.discard(employee_id)
+                    if not employees:
+                        del self._ws_to_emps[previous.id]
+            
+            self._active_workspaces[employee_id] = workspace.model_copy(deep=True)
+            self._ws_to_emps[workspace_id].add(employee_id)
         
         logger.info(f"Employee {employee_id} switched to workspace '{workspace.workspace_name}' (ID: {workspace_id})")
         
@@ -310,15 +439,13 @@ class WorkspaceService:
             employee_id: Employee ID
             
         Returns:
-            Active workspace or None
+            Copy of the active workspace, or None
             
         Validates: Requirement 9.3
         """
-        workspace_id = self._active_workspaces.get(employee_id)
-        if workspace_id:
-            return self.get_workspace_by_id(workspace_id)
-        
-        return None
+        with self._active_workspaces_lock:
+            workspace = self._active_workspaces.get(employee_id)
+        return workspace.model_copy(deep=True) if workspace is not None else None
     
     # ========================================================================
     # Configuration Export/Import
@@ -339,21 +466,34 @@ class WorkspaceService:
             
         Validates: Requirement 9.5
         """
+        return self._build_workspace_export(workspace_id).model_dump(mode='json')
+    
+    def _build_workspace_export(self, workspace_id: int) -> WorkspaceExport:
+        """
+        Build the export model of a workspace
+        
+        Args:
+            workspace_id: Workspace ID
+            
+        Returns:
+            WorkspaceExport instance
+            
+        Raises:
+            ValueError: If workspace not found
+        """
         workspace = self.get_workspace_by_id(workspace_id)
         if not workspace:
             raise ValueError(f"Workspace ID {workspace_id} không tồn tại")
         
-        export_data = {
-            'workspace_name': workspace.workspace_name,
-            'configuration': workspace.configuration or {},
-            'is_active': workspace.is_active,
-            'exported_at': datetime.now().isoformat(),
-            'version': '1.0'
-        }
+        export = WorkspaceExport(
+            workspace_name=workspace.workspace_name,
+            configuration=workspace.configuration or {},
+            is_active=workspace.is_active
+        )
         
         logger.info(f"Exported configuration for workspace ID {workspace_id}")
         
-        return export_data
+        return export
     
     def import_workspace_configuration(
         self,
@@ -404,10 +544,9 @@ class WorkspaceService:
             workspace = self.create_workspace(
                 employee_id=employee_id,
                 workspace_name=workspace_name,
-                configuration=configuration
+                configuration=configuration,
+                is_active=is_active
             )
-            if not is_active:
-                workspace = self.update_workspace(workspace.id, is_active=False)
             
             logger.info(f"Imported configuration created new workspace '{workspace_name}' (ID: {workspace.id})")
         
@@ -425,8 +564,8 @@ class WorkspaceService:
             
         Validates: Requirement 9.5
         """
-        config = self.export_workspace_configuration(workspace_id)
-        return json.dumps(config, indent=2, ensure_ascii=False)
+        # pydantic-core serializes straight to JSON without an intermediate dict
+        return self._build_workspace_export(workspace_id).model_dump_json(indent=2)
     
     def import_workspace_from_json(
         self,
@@ -451,7 +590,7 @@ class WorkspaceService:
         Validates: Requirement 9.5
         """
         try:
-            import_data = json.loads(json_string)
+            import_data = _loads_json(json_string)
         except json.JSONDecodeError as e:
             raise ValueError(f"JSON không hợp lệ: {str(e)}")
         
@@ -465,7 +604,8 @@ class WorkspaceService:
         self,
         workspace_id: int,
         department_id: Optional[int] = None,
-        status: str = 'active'
+        status: str = 'active',
+        columns: Optional[Sequence[str]] = None
     ) -> List[Dict[str, Any]]:
         """
         Get business records for a specific workspace
@@ -474,24 +614,127 @@ class WorkspaceService:
             workspace_id: Workspace ID
             department_id: Optional department filter
             status: Record status filter
+            columns: Columns to return (default: all columns)
             
         Returns:
             List of business records
             
+        Raises:
+            ValueError: If an unknown column is requested
+            
         Validates: Requirement 9.4 (Data isolation)
         """
-        query = "SELECT * FROM business_records WHERE workspace_id = ? AND status = ?"
+        query, params = self._workspace_records_query(workspace_id, department_id, status, columns)
+        query += " ORDER BY created_at DESC"
+        
+        return self.db.execute_query(query, params)
+    
+    def iter_workspace_records(
+        self,
+        workspace_id: int,
+        department_id: Optional[int] = None,
+        status: str = 'active',
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = 500
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Stream business records of a workspace in keyset batches
+        
+        Each batch is a separate query, so no pooled connection is held while
+        the caller processes records or if it stops early.
+        
+        Args:
+            workspace_id: Workspace ID
+            department_id: Optional department filter
+            status: Record status filter
+            columns: Columns to return (default: all columns)
+            batch_size: Number of rows fetched per query
+            
+        Yields:
+            Business records, newest first
+            
+        Raises:
+            ValueError: If an unknown column is requested
+        """
+        # The keyset needs created_at and id, fetch them even when not requested
+        hidden = [c for c in ('created_at', 'id') if columns and c not in columns]
+        query, params = self._workspace_records_query(
+            workspace_id, department_id, status,
+            list(columns) + hidden if columns else None
+        )
+        sort_key = "COALESCE(created_at, '')"
+        page_query = query + f" ORDER BY {sort_key} DESC, id DESC LIMIT ?"
+        next_query = (query + f" AND ({sort_key} < ? OR ({sort_key} = ? AND id < ?))"
+                      f" ORDER BY {sort_key} DESC, id DESC LIMIT ?")
+        
+        batch = self.db.execute_query(page_query, params + [batch_size], use_cache=False)
+        while batch:
+            last = batch[-1]
+            last_key, last_id = last['created_at'] or '', last['id']
+            for record in batch:
+                for column in hidden:
+                    del record[column]
+                yield record
+            
+            if len(batch) < batch_size:
+                return
+            batch = self.db.execute_query(
+                next_query, params + [last_key, last_key, last_id, batch_size], use_cache=False
+            )
+    
+    def _workspace_records_query(
+        self,
+        workspace_id: int,
+        department_id: Optional[int],
+        status: str,
+        columns: Optional[Sequence[str]]
+    ) -> Tuple[str, List[Any]]:
+        """
+        Build the unordered business records query for a workspace
+        
+        Returns:
+            Tuple of (query, params list)
+            
+        Raises:
+            ValueError: If an unknown column is requested
+        """
+        if columns:
+            unknown = set(columns) - _RECORD_COLUMNS
+            if unknown:
+                raise ValueError(f"Cột không hợp lệ: {', '.join(sorted(unknown))}")
+            select_columns = ", ".join(columns)
+        else:
+            select_columns = "*"
+        
+        query = f"SELECT {select_columns} FROM business_records WHERE workspace_id = ? AND status = ?"
         params = [workspace_id, status]
         
         if department_id is not None:
             query += " AND department_id = ?"
             params.append(department_id)
         
-        query += " ORDER BY created_at DESC"
+        return query, params
+    
+    def get_workspace_record_stats(self, workspace_id: int) -> Dict[str, int]:
+        """
+        Count business records of a workspace per status in a single query
         
-        results = self.db.execute_query(query, tuple(params))
+        Args:
+            workspace_id: Workspace ID
+            
+        Returns:
+            Dictionary with 'active', 'archived', 'deleted' and 'total' counts
+            
+        Validates: Requirement 9.4 (Data isolation)
+        """
+        results = self.db.execute_query(_SQL_RECORD_STATS, (workspace_id,), use_cache=False)
+        row = results[0] if results else {}
         
-        return results
+        # SUM over no rows is NULL
+        return {
+            key: row.get(key) or 0
+            for key in ('active', 'archived', 'deleted', 'total')
+        }
     
     def create_workspace_record(
         self,
@@ -512,26 +755,21 @@ class WorkspaceService:
         Returns:
             Created record ID
             
+        Raises:
+            ValueError: If workspace not found, doesn't belong to employee or is inactive
+            
         Validates: Requirement 9.4 (Data isolation)
         """
-        # Verify workspace exists and belongs to employee
-        workspace = self.get_workspace_by_id(workspace_id)
-        if not workspace:
-            raise ValueError(f"Workspace ID {workspace_id} không tồn tại")
-        
-        if workspace.employee_id != employee_id:
-            raise ValueError(f"Workspace ID {workspace_id} không thuộc về nhân viên {employee_id}")
+        # Verify workspace exists, belongs to employee and is active
+        if not self._verify_ownership(workspace_id, employee_id):
+            raise ValueError(f"Workspace ID {workspace_id} không hoạt động")
         
         # Serialize record data
-        record_json = json.dumps(record_data, ensure_ascii=False)
+        record_json = _dumps_json(record_data)
         
         # Insert record
         record_id = self.db.execute_insert(
-            """
-            INSERT INTO business_records 
-            (department_id, employee_id, workspace_id, record_data, status)
-            VALUES (?, ?, ?, ?, ?)
-            """,
+            _SQL_INSERT_RECORD,
             (department_id, employee_id, workspace_id, record_json, 'active')
         )
         
@@ -539,25 +777,150 @@ class WorkspaceService:
         
         return record_id
     
+    def create_workspace_records_bulk(
+        self,
+        workspace_id: int,
+        department_id: int,
+        employee_id: int,
+        records: List[Dict[str, Any]]
+    ) -> int:
+        """
+        Create multiple business records in a workspace in a single transaction
+        
+        Args:
+            workspace_id: Workspace ID
+            department_id: Department ID
+            employee_id: Employee ID
+            records: List of record data dictionaries
+            
+        Returns:
+            Number of records created
+            
+        Raises:
+            ValueError: If workspace not found, doesn't belong to employee or is inactive
+            
+        Validates: Requirement 9.4 (Data isolation)
+        """
+        if not records:
+            return 0
+        
+        # Verify ownership and active status once for the whole batch
+        if not self._verify_ownership(workspace_id, employee_id):
+            raise ValueError(f"Workspace ID {workspace_id} không hoạt động")
+        
+        params_list = [
+            (department_id, employee_id, workspace_id, _dumps_json(record_data), 'active')
+            for record_data in records
+        ]
+        
+        created = self.db.execute_many(_SQL_INSERT_RECORD, params_list)
+        
+        logger.info(f"Created {created} records in workspace {workspace_id}")
+        
+        return created
+    
     # ========================================================================
     # Helper Methods
     # ========================================================================
     
-    def _row_to_workspace(self, row: Dict[str, Any]) -> EmployeeWorkspace:
+    @staticmethod
+    def _is_name_conflict(error: DatabaseError) -> bool:
+        """
+        Check whether a database error comes from the UNIQUE(employee_id, workspace_name) constraint
+        
+        Args:
+            error: Error raised by the database manager
+            
+        Returns:
+            True if the workspace name is already used by the employee
+        """
+        return 'UNIQUE constraint failed: employee_workspaces.employee_id, employee_workspaces.workspace_name' in str(error)
+    
+    def _cache_row(self, row: Dict[str, Any]) -> None:
+        """
+        Cache a full workspace row under both its ID and name keys
+        
+        The cache holds rows, never models: each lookup builds a fresh
+        workspace, so callers mutating one cannot change the cache.
+        
+        Args:
+            row: employee_workspaces row as returned by execute_query
+        """
+        self._ws_cache.set(('id', row['id']), row)
+        self._ws_cache.set(('name', row['employee_id'], row['workspace_name']), row)
+    
+    def _invalidate_workspace(self, workspace: EmployeeWorkspace) -> None:
+        """
+        Remove a workspace from every cache entry that may hold it
+        
+        Args:
+            workspace: Workspace whose cached lookups should be dropped
+        """
+        self._ws_cache.delete(('id', workspace.id))
+        self._ws_cache.delete(('name', workspace.employee_id, workspace.workspace_name))
+        self._invalidate_employee_lists(workspace.employee_id)
+    
+    def _invalidate_employee_lists(self, employee_id: int) -> None:
+        """
+        Remove cached workspace lists of an employee
+        
+        Args:
+            employee_id: Employee ID
+        """
+        self._ws_cache.delete(('employee', employee_id, False))
+        self._ws_cache.delete(('employee', employee_id, True))
+    
+    def _verify_ownership(self, workspace_id: int, employee_id: int) -> bool:
+        """
+        Verify a workspace exists and belongs to an employee without loading the full row
+        
+        Args:
+            workspace_id: Workspace ID
+            employee_id: Employee ID expected to own the workspace
+            
+        Returns:
+            Whether the workspace is active
+            
+        Raises:
+            ValueError: If workspace not found or doesn't belong to employee
+        """
+        results = self.db.execute_query(
+            _SQL_SELECT_WORKSPACE_OWNER,
+            (workspace_id,),
+            use_cache=False
+        )
+        
+        if not results:
+            raise ValueError(f"Workspace ID {workspace_id} không tồn tại")
+        
+        if results[0]['employee_id'] != employee_id:
+            raise ValueError(f"Workspace ID {workspace_id} không thuộc về nhân viên {employee_id}")
+        
+        return bool(results[0]['is_active'])
+    
+    def _row_to_workspace(
+        self,
+        row: Union[Dict[str, Any], sqlite3.Row]
+    ) -> EmployeeWorkspace:
         """
         Convert database row to EmployeeWorkspace model
         
         Args:
-            row: Database row as dictionary
+            row: Database row as dictionary or sqlite3.Row
             
         Returns:
             EmployeeWorkspace instance
         """
-        # Parse configuration JSON
+        # sqlite3.Row has no .get(); list projections omit configuration/created_at
+        keys = row.keys()
+        raw_configuration = row['configuration'] if 'configuration' in keys else None
+        created_at = row['created_at'] if 'created_at' in keys else None
+        
+        # Parse configuration JSON (absent when the column was not selected)
         configuration = None
-        if row.get('configuration'):
+        if raw_configuration:
             try:
-                configuration = json.loads(row['configuration'])
+                configuration = _loads_json(raw_configuration)
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse configuration for workspace ID {row['id']}")
                 configuration = {}
@@ -568,5 +931,5 @@ class WorkspaceService:
             workspace_name=row['workspace_name'],
             is_active=bool(row['is_active']),
             configuration=configuration,
-            created_at=row.get('created_at')
+            created_at=created_at
         )
@@ -10,74 +10,266 @@ Provides comprehensive date and time handling utilities including:
 Requirements: 18.1
 """
 
-from datetime import datetime, timedelta, date
-from typing import Optional, Tuple
+from datetime import datetime, timedelta, date, time
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Tuple
 import pytz
 
 
+# Common date formats (also exposed as DateTimeUtils.FORMAT_*)
+FORMAT_DATE = "%Y-%m-%d"
+FORMAT_DATETIME = "%Y-%m-%d %H:%M:%S"
+FORMAT_DISPLAY = "%d/%m/%Y"
+FORMAT_DISPLAY_DATETIME = "%d/%m/%Y %H:%M:%S"
+FORMAT_ISO = "%Y-%m-%dT%H:%M:%S"
+
+# Formats tried by parse_date when the requested format does not match
+_FALLBACK_FORMATS = (FORMAT_DATE, FORMAT_DATETIME, FORMAT_ISO, "%d-%m-%Y", "%Y/%m/%d")
+
+# Built-in formats that all start with a number and need at least 8 characters
+_NUMERIC_FORMATS = frozenset(_FALLBACK_FORMATS + (FORMAT_DISPLAY, FORMAT_DISPLAY_DATETIME))
+
+# Days per month in a non-leap year
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# Day boundaries used by get_start_of_* / get_end_of_day
+_MIDNIGHT = time(0, 0, 0, 0)
+_END_OF_DAY = time(23, 59, 59, 999999)
+_ONE_DAY = timedelta(days=1)
+
+# Weekday names per locale, indexed by datetime.weekday()
+_WEEKDAYS = {
+    "vi": ("Thứ Hai", "Thứ Ba", "Thứ Tư", "Thứ Năm", "Thứ Sáu", "Thứ Bảy", "Chủ Nhật"),
+    "en": ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"),
+}
+
+
+def _days_in_month(year: int, month: int) -> int:
+    """Return the number of days in the given month"""
+    if month == 2 and (year & 3) == 0 and (year % 100 != 0 or year % 400 == 0):
+        return 29
+    return _DAYS_IN_MONTH[month - 1]
+
+
+@lru_cache(maxsize=64)
+def _get_tz(name: str):
+    """Return the pytz timezone for name, reusing the instance across calls"""
+    return pytz.timezone(name)
+
+
+def format_date(dt: datetime, format_str: str = FORMAT_DISPLAY) -> str:
+    """
+    Format datetime object to string
+    
+    Args:
+        dt: Datetime object to format
+        format_str: Format string (default: DD/MM/YYYY)
+        
+    Returns:
+        Formatted date string
+    """
+    if dt is None:
+        return ""
+    return dt.strftime(format_str)
+
+
+def parse_date(date_str: str, format_str: str = FORMAT_DISPLAY) -> Optional[datetime]:
+    """
+    Parse date string to datetime object
+    
+    Args:
+        date_str: Date string to parse
+        format_str: Format string (default: DD/MM/YYYY)
+        
+    Returns:
+        Datetime object or None if parsing fails
+    """
+    if not date_str:
+        return None
+    
+    # Reject strings no built-in format can match without calling strptime
+    if format_str in _NUMERIC_FORMATS and (
+            len(date_str) < 8 or not date_str[0].isdigit()):
+        return None
+    
+    try:
+        return datetime.strptime(date_str, format_str)
+    except ValueError:
+        pass
+    
+    # Try the fallback format matching the string's shape before the rest
+    guessed = _guess_format(date_str)
+    if guessed is not None and guessed != format_str:
+        try:
+            return datetime.strptime(date_str, guessed)
+        except ValueError:
+            pass
+    
+    for fmt in _FALLBACK_FORMATS:
+        if fmt == guessed or fmt == format_str:
+            continue
+        try:
+            return datetime.strptime(date_str, fmt)
+        except ValueError:
+            continue
+    
+    return None
+
+
+def _guess_format(date_str: str) -> Optional[str]:
+    """
+    Pick the fallback format a date string most likely uses from its shape
+    
+    Args:
+        date_str: Date string to inspect
+        
+    Returns:
+        One of _FALLBACK_FORMATS, or None if the shape is not recognized
+    """
+    length = len(date_str)
+    if length == 10:
+        if date_str[4] == '-':
+            return FORMAT_DATE
+        if date_str[2] == '-':
+            return "%d-%m-%Y"
+        if date_str[4] == '/':
+            return "%Y/%m/%d"
+    elif length == 19:
+        if date_str[10] == ' ':
+            return FORMAT_DATETIME
+        if date_str[10] == 'T':
+            return FORMAT_ISO
+    return None
+
+
+def add_days(dt: datetime, days: int) -> datetime:
+    """
+    Add days to datetime
+    
+    Args:
+        dt: Base datetime
+        days: Number of days to add (can be negative)
+        
+    Returns:
+        New datetime with days added
+    """
+    # Scaling a prebuilt timedelta skips the keyword-argument constructor
+    if days == 1:
+        return dt + _ONE_DAY
+    return dt + _ONE_DAY * days
+
+
+def diff_days(dt1: datetime, dt2: datetime) -> int:
+    """
+    Calculate difference in days between two dates
+    
+    Args:
+        dt1: First datetime
+        dt2: Second datetime
+        
+    Returns:
+        Number of days between dates (dt1 - dt2)
+    """
+    # toordinal() ignores the time of day, like comparing .date() values
+    return dt1.toordinal() - dt2.toordinal()
+
+
+def is_weekend(dt: datetime) -> bool:
+    """
+    Check if date is weekend (Saturday or Sunday)
+    
+    Args:
+        dt: Datetime to check
+        
+    Returns:
+        True if weekend, False otherwise
+    """
+    return dt.weekday() >= 5
+
+
 class DateTimeUtils:
     """Utility class for date and time operations"""
     
     # Common date formats
-    FORMAT_DATE = "%Y-%m-%d"
-    FORMAT_DATETIME = "%Y-%m-%d %H:%M:%S"
-    FORMAT_DISPLAY = "%d/%m/%Y"
-    FORMAT_DISPLAY_DATETIME = "%d/%m/%Y %H:%M:%S"
-    FORMAT_ISO = "%Y-%m-%dT%H:%M:%S"
+    FORMAT_DATE = FORMAT_DATE
+    FORMAT_DATETIME = FORMAT_DATETIME
+    FORMAT_DISPLAY = FORMAT_DISPLAY
+    FORMAT_DISPLAY_DATETIME = FORMAT_DISPLAY_DATETIME
+    FORMAT_ISO = FORMAT_ISO
     
     # Default timezone
     DEFAULT_TIMEZONE = "Asia/Ho_Chi_Minh"
     
+    # Hot helpers are module-level functions; callers in tight loops can
+    # import them directly instead of going through the class
+    format_date = staticmethod(format_date)
+    parse_date = staticmethod(parse_date)
+    add_days = staticmethod(add_days)
+    diff_days = staticmethod(diff_days)
+    is_weekend = staticmethod(is_weekend)
+    
     @staticmethod
-    def format_date(dt: datetime, format_str: str = FORMAT_DISPLAY) -> str:
+    def parse_date_strict(date_str: str, format_str: str = FORMAT_DISPLAY) -> datetime:
         """
-        Format datetime object to string
+        Parse date string to datetime object, raising on failure
         
         Args:
-            dt: Datetime object to format
+            date_str: Date string to parse
             format_str: Format string (default: DD/MM/YYYY)
             
         Returns:
-            Formatted date string
+            Datetime object
+            
+        Raises:
+            ValueError: If the string matches none of the supported formats
         """
-        if dt is None:
-            return ""
-        return dt.strftime(format_str)
+        result = parse_date(date_str, format_str)
+        if result is None:
+            raise ValueError(f"Ngày không hợp lệ: '{date_str}'")
+        return result
     
     @staticmethod
-    def parse_date(date_str: str, format_str: str = FORMAT_DISPLAY) -> Optional[datetime]:
+    def parse_dates_batch(date_strs: Sequence[Optional[str]],
+                          format_str: Optional[str] = FORMAT_DISPLAY) -> Any:
         """
-        Parse date string to datetime object
+        Parse many date strings at once (bulk import)
+        
+        Parsing runs inside pandas, which also reuses results for repeated
+        strings. Unlike parse_date, no fallback formats are tried.
         
         Args:
-            date_str: Date string to parse
-            format_str: Format string (default: DD/MM/YYYY)
+            date_strs: Date strings to parse
+            format_str: Format shared by all strings (None lets pandas infer it)
             
         Returns:
-            Datetime object or None if parsing fails
+            NumPy datetime64 array, NaT where a string is empty or invalid
         """
-        if not date_str:
-            return None
+        import pandas as pd
         
-        try:
-            return datetime.strptime(date_str, format_str)
-        except ValueError:
-            # Try alternative formats
-            formats = [
-                DateTimeUtils.FORMAT_DATE,
-                DateTimeUtils.FORMAT_DATETIME,
-                DateTimeUtils.FORMAT_ISO,
-                "%d-%m-%Y",
-                "%Y/%m/%d"
-            ]
-            
-            for fmt in formats:
-                try:
-                    return datetime.strptime(date_str, fmt)
-                except ValueError:
-                    continue
+        parsed = pd.to_datetime(
+            pd.Series(list(date_strs), dtype=object),
+            format=format_str,
+            errors='coerce',
+            cache=True
+        )
+        return parsed.to_numpy()
+    
+    @staticmethod
+    def format_dates_batch(values: Sequence[Any], format_str: str = FORMAT_DISPLAY) -> List[str]:
+        """
+        Format many datetimes at once (bulk export)
+        
+        Args:
+            values: Datetimes, datetime64 values or None
+            format_str: Format string (default: DD/MM/YYYY)
             
-            return None
+        Returns:
+            Formatted strings, "" for missing values
+        """
+        import pandas as pd
+        
+        formatted = pd.DatetimeIndex(values).strftime(format_str)
+        return [text if isinstance(text, str) else "" for text in formatted]
     
     @staticmethod
     def now(timezone: str = DEFAULT_TIMEZONE) -> datetime:
@@ -90,7 +282,7 @@ class DateTimeUtils:
         Returns:
             Current datetime with timezone
         """
-        tz = pytz.timezone(timezone)
+        tz = _DEFAULT_TZ if timezone == DateTimeUtils.DEFAULT_TIMEZONE else _get_tz(timezone)
         return datetime.now(tz)
     
     @staticmethod
@@ -103,20 +295,6 @@ class DateTimeUtils:
         """
         return date.today()
     
-    @staticmethod
-    def add_days(dt: datetime, days: int) -> datetime:
-        """
-        Add days to datetime
-        
-        Args:
-            dt: Base datetime
-            days: Number of days to add (can be negative)
-            
-        Returns:
-            New datetime with days added
-        """
-        return dt + timedelta(days=days)
-    
     @staticmethod
     def add_months(dt: datetime, months: int) -> datetime:
         """
@@ -129,10 +307,11 @@ class DateTimeUtils:
         Returns:
             New datetime with months added
         """
-        month = dt.month - 1 + months
-        year = dt.year + month // 12
-        month = month % 12 + 1
-        day = min(dt.day, [31, 29 if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0) else 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31][month - 1])
+        total = dt.month - 1 + months
+        year = dt.year + total // 12
+        month = total % 12 + 1
+        max_day = _days_in_month(year, month)
+        day = dt.day if dt.day < max_day else max_day
         return dt.replace(year=year, month=month, day=day)
     
     @staticmethod
@@ -149,20 +328,6 @@ class DateTimeUtils:
         """
         return DateTimeUtils.add_months(dt, years * 12)
     
-    @staticmethod
-    def diff_days(dt1: datetime, dt2: datetime) -> int:
-        """
-        Calculate difference in days between two dates
-        
-        Args:
-            dt1: First datetime
-            dt2: Second datetime
-            
-        Returns:
-            Number of days between dates (dt1 - dt2)
-        """
-        return (dt1.date() - dt2.date()).days
-    
     @staticmethod
     def diff_hours(dt1: datetime, dt2: datetime) -> float:
         """
@@ -217,7 +382,7 @@ class DateTimeUtils:
             return False, "Ngày bắt đầu phải trước hoặc bằng ngày kết thúc"
         
         if max_days is not None:
-            days_diff = DateTimeUtils.diff_days(end_date, start_date)
+            days_diff = diff_days(end_date, start_date)
             if days_diff > max_days:
                 return False, f"Khoảng thời gian không được vượt quá {max_days} ngày"
         
@@ -236,8 +401,8 @@ class DateTimeUtils:
         Returns:
             Datetime in target timezone
         """
-        from_timezone = pytz.timezone(from_tz)
-        to_timezone = pytz.timezone(to_tz)
+        from_timezone = _get_tz(from_tz)
+        to_timezone = _get_tz(to_tz)
         
         # Localize if naive
         if dt.tzinfo is None:
@@ -256,7 +421,7 @@ class DateTimeUtils:
         Returns:
             Datetime at start of day
         """
-        return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+        return datetime.combine(dt.date(), _MIDNIGHT, tzinfo=dt.tzinfo)
     
     @staticmethod
     def get_end_of_day(dt: datetime) -> datetime:
@@ -269,7 +434,7 @@ class DateTimeUtils:
         Returns:
             Datetime at end of day
         """
-        return dt.replace(hour=23, minute=59, second=59, microsecond=999999)
+        return datetime.combine(dt.date(), _END_OF_DAY, tzinfo=dt.tzinfo)
     
     @staticmethod
     def get_start_of_month(dt: datetime) -> datetime:
@@ -282,7 +447,7 @@ class DateTimeUtils:
         Returns:
             Datetime at start of month
         """
-        return dt.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return datetime.combine(dt.date().replace(day=1), _MIDNIGHT, tzinfo=dt.tzinfo)
     
     @staticmethod
     def get_end_of_month(dt: datetime) -> datetime:
@@ -295,22 +460,8 @@ class DateTimeUtils:
         Returns:
             Datetime at end of month
         """
-        next_month = DateTimeUtils.add_months(dt, 1)
-        first_of_next = next_month.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-        return first_of_next - timedelta(microseconds=1)
-    
-    @staticmethod
-    def is_weekend(dt: datetime) -> bool:
-        """
-        Check if date is weekend (Saturday or Sunday)
-        
-        Args:
-            dt: Datetime to check
-            
-        Returns:
-            True if weekend, False otherwise
-        """
-        return dt.weekday() >= 5
+        last_day = _days_in_month(dt.year, dt.month)
+        return dt.replace(day=last_day, hour=23, minute=59, second=59, microsecond=999999)
     
     @staticmethod
     def get_weekday_name(dt: datetime, locale: str = "vi") -> str:
@@ -324,12 +475,8 @@ class DateTimeUtils:
         Returns:
             Weekday name
         """
-        weekdays_vi = ["Thứ Hai", "Thứ Ba", "Thứ Tư", "Thứ Năm", "Thứ Sáu", "Thứ Bảy", "Chủ Nhật"]
-        weekdays_en = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        
-        weekday = dt.weekday()
-        
-        if locale == "vi":
-            return weekdays_vi[weekday]
-        else:
-            return weekdays_en[weekday]
+        # Unknown locales fall back to English
+        return _WEEKDAYS.get(locale, _WEEKDAYS["en"])[dt.weekday()]
+
+
+_DEFAULT_TZ = _get_tz(DateTimeUtils.DEFAULT_TIMEZONE)
@@ -8,13 +8,31 @@ Requirements: 17.1, 17.3, 17.4
 """
 
 import logging
+import time
 import traceback
+from types import MappingProxyType
 from typing import Optional, Callable, Any
 from functools import wraps
 
 # Get logger
 logger = logging.getLogger(__name__)
 
+# QMessageBox class once resolved (None if PyQt6 is unavailable)
+_UNRESOLVED = object()
+_message_box_class = _UNRESOLVED
+
+
+def _get_message_box():
+    """Import QMessageBox on first use and remember the result"""
+    global _message_box_class
+    if _message_box_class is _UNRESOLVED:
+        try:
+            from PyQt6.QtWidgets import QMessageBox
+            _message_box_class = QMessageBox
+        except ImportError:
+            _message_box_class = None
+    return _message_box_class
+
 
 # ============================================================================
 # Custom Exceptions
@@ -22,6 +40,9 @@ logger = logging.getLogger(__name__)
 
 class ValidationError(Exception):
     """Lỗi validation dữ liệu"""
+    __slots__ = ('field',)
+    friendly = "Dữ liệu không hợp lệ"
+    
     def __init__(self, message: str, field: Optional[str] = None):
         self.field = field
         super().__init__(message)
@@ -29,6 +50,9 @@ class ValidationError(Exception):
 
 class DatabaseError(Exception):
     """Lỗi cơ sở dữ liệu"""
+    __slots__ = ('query',)
+    friendly = "Lỗi cơ sở dữ liệu"
+    
     def __init__(self, message: str, query: Optional[str] = None):
         self.query = query
         super().__init__(message)
@@ -36,6 +60,9 @@ class DatabaseError(Exception):
 
 class FormulaError(Exception):
     """Lỗi công thức"""
+    __slots__ = ('formula',)
+    friendly = "Lỗi công thức tính toán"
+    
     def __init__(self, message: str, formula: Optional[str] = None):
         self.formula = formula
         super().__init__(message)
@@ -43,6 +70,9 @@ class FormulaError(Exception):
 
 class WorkflowError(Exception):
     """Lỗi workflow"""
+    __slots__ = ('workflow_id',)
+    friendly = "Lỗi quy trình làm việc"
+    
     def __init__(self, message: str, workflow_id: Optional[int] = None):
         self.workflow_id = workflow_id
         super().__init__(message)
@@ -50,6 +80,9 @@ class WorkflowError(Exception):
 
 class ConfigurationError(Exception):
     """Lỗi cấu hình"""
+    __slots__ = ('config_key',)
+    friendly = "Lỗi cấu hình hệ thống"
+    
     def __init__(self, message: str, config_key: Optional[str] = None):
         self.config_key = config_key
         super().__init__(message)
@@ -57,6 +90,9 @@ class ConfigurationError(Exception):
 
 class ImportExportError(Exception):
     """Lỗi import/export dữ liệu"""
+    __slots__ = ('file_path',)
+    friendly = "Lỗi import/export dữ liệu"
+    
     def __init__(self, message: str, file_path: Optional[str] = None):
         self.file_path = file_path
         super().__init__(message)
@@ -64,221 +100,231 @@ class ImportExportError(Exception):
 
 class TransportConnectionError(Exception):
     """Lỗi kết nối"""
+    __slots__ = ('resource',)
+    friendly = "Lỗi kết nối"
+    
     def __init__(self, message: str, resource: Optional[str] = None):
         self.resource = resource
         super().__init__(message)
 
 
 # ============================================================================
-# Error Handler Class
+# Error Handler
 # ============================================================================
 
-class ErrorHandler:
+def handle_error(
+    error: Exception,
+    context: str,
+    show_dialog: bool = False,
+    reraise: bool = False
+) -> Optional[str]:
     """
-    Centralized error handling with logging and user-friendly messages.
+    Handle error with logging and optional user notification.
     
-    Provides methods to handle different types of errors consistently
-    across the application.
+    Args:
+        error: The exception that occurred
+        context: Context description where error occurred
+        show_dialog: Whether to show GUI dialog (requires PyQt6)
+        reraise: Whether to re-raise the exception after handling
+        
+    Returns:
+        User-friendly error message
     """
+    # Get error type and message
+    error_type = type(error)
+    error_message = str(error)
     
-    # Error message templates
-    ERROR_MESSAGES = {
-        ValidationError: "Dữ liệu không hợp lệ",
-        DatabaseError: "Lỗi cơ sở dữ liệu",
-        FormulaError: "Lỗi công thức tính toán",
-        WorkflowError: "Lỗi quy trình làm việc",
-        ConfigurationError: "Lỗi cấu hình hệ thống",
-        ImportExportError: "Lỗi import/export dữ liệu",
-        TransportConnectionError: "Lỗi kết nối",
-        Exception: "Lỗi không xác định"
-    }
+    # Get user-friendly message template
+    friendly_message = getattr(error_type, 'friendly', _DEFAULT_ERROR_MSG)
     
-    @staticmethod
-    def handle_error(
-        error: Exception,
-        context: str,
-        show_dialog: bool = False,
-        reraise: bool = False
-    ) -> Optional[str]:
-        """
-        Handle error with logging and optional user notification.
-        
-        Args:
-            error: The exception that occurred
-            context: Context description where error occurred
-            show_dialog: Whether to show GUI dialog (requires PyQt6)
-            reraise: Whether to re-raise the exception after handling
-            
-        Returns:
-            User-friendly error message
-        """
-        # Get error type and message
-        error_type = type(error)
-        error_message = str(error)
-        
-        # Get user-friendly message template
-        friendly_message = ErrorHandler.ERROR_MESSAGES.get(
-            error_type,
-            ErrorHandler.ERROR_MESSAGES[Exception]
-        )
-        
-        # Build full message
+    # Build full message
+    if context:
+        full_message = f"{context}\n{friendly_message}: {error_message}"
+    else:
         full_message = f"{friendly_message}: {error_message}"
-        if context:
-            full_message = f"{context}\n{full_message}"
-        
-        # Log the error with full traceback
-        logger.error(
-            f"Error in {context}: {error_type.__name__}: {error_message}",
-            exc_info=True
-        )
-        
-        # Show dialog if requested
-        if show_dialog:
-            try:
-                from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.critical(None, "Lỗi", full_message)
-            except ImportError:
-                # PyQt6 not available, just log
-                logger.warning("PyQt6 not available for error dialog")
-        
-        # Re-raise if requested
-        if reraise:
-            raise error
-        
-        return full_message
     
-    @staticmethod
-    def handle_validation_error(
-        errors: list[str],
-        show_dialog: bool = False
-    ) -> str:
-        """
-        Handle validation errors with multiple error messages.
-        
-        Args:
-            errors: List of validation error messages
-            show_dialog: Whether to show GUI dialog
-            
-        Returns:
-            Formatted error message
-        """
-        if not errors:
-            return ""
-        
-        # Format error message
-        message = "Dữ liệu không hợp lệ:\n" + "\n".join(f"• {e}" for e in errors)
-        
-        # Log validation errors
-        logger.warning(f"Validation errors: {errors}")
-        
-        # Show dialog if requested
-        if show_dialog:
-            try:
-                from PyQt6.QtWidgets import QMessageBox
-                QMessageBox.warning(None, "Lỗi Validation", message)
-            except ImportError:
-                logger.warning("PyQt6 not available for validation dialog")
-        
-        return message
+    # Log the error with full traceback (formatted only if ERROR is enabled)
+    logger.error(
+        "Error in %s: %s: %s", context, error_type.__name__, error_message,
+        exc_info=True
+    )
     
-    @staticmethod
-    def handle_database_error(
-        error: Exception,
-        query: Optional[str] = None,
-        show_dialog: bool = False
-    ) -> str:
-        """
-        Handle database-specific errors.
-        
-        Args:
-            error: The database exception
-            query: Optional SQL query that caused the error
-            show_dialog: Whether to show GUI dialog
-            
-        Returns:
-            User-friendly error message
-        """
-        context = "Thao tác cơ sở dữ liệu"
-        if query:
-            logger.error(f"Database error with query: {query}")
-        
-        return ErrorHandler.handle_error(error, context, show_dialog)
+    # Show dialog if requested
+    if show_dialog:
+        message_box = _get_message_box()
+        if message_box is not None:
+            message_box.critical(None, "Lỗi", full_message)
+        else:
+            # PyQt6 not available, just log
+            logger.warning("PyQt6 not available for error dialog")
     
-    @staticmethod
-    def handle_formula_error(
-        error: Exception,
-        formula: Optional[str] = None,
-        show_dialog: bool = False
-    ) -> str:
-        """
-        Handle formula-specific errors.
+    # Re-raise if requested
+    if reraise:
+        raise error
+    
+    return full_message
+
+
+def handle_validation_error(
+    errors: list[str],
+    show_dialog: bool = False
+) -> str:
+    """
+    Handle validation errors with multiple error messages.
+    
+    Args:
+        errors: List of validation error messages
+        show_dialog: Whether to show GUI dialog
         
-        Args:
-            error: The formula exception
-            formula: Optional formula expression that caused the error
-            show_dialog: Whether to show GUI dialog
-            
-        Returns:
-            User-friendly error message
-        """
-        context = "Tính toán công thức"
-        if formula:
-            logger.error(f"Formula error with expression: {formula}")
+    Returns:
+        Formatted error message
+    """
+    if not errors:
+        return ""
+    
+    # Format error message
+    message = "Dữ liệu không hợp lệ:\n" + "\n".join(f"• {e}" for e in errors)
+    
+    # Log validation errors
+    logger.warning("Validation errors: %s", errors)
+    
+    # Show dialog if requested
+    if show_dialog:
+        message_box = _get_message_box()
+        if message_box is not None:
+            message_box.warning(None, "Lỗi Validation", message)
+        else:
+            logger.warning("PyQt6 not available for validation dialog")
+    
+    return message
+
+
+def handle_database_error(
+    error: Exception,
+    query: Optional[str] = None,
+    show_dialog: bool = False
+) -> str:
+    """
+    Handle database-specific errors.
+    
+    Args:
+        error: The database exception
+        query: Optional SQL query that caused the error
+        show_dialog: Whether to show GUI dialog
         
-        return ErrorHandler.handle_error(error, context, show_dialog)
+    Returns:
+        User-friendly error message
+    """
+    context = "Thao tác cơ sở dữ liệu"
+    if query:
+        logger.error("Database error with query: %s", query)
     
-    @staticmethod
-    def handle_workflow_error(
-        error: Exception,
-        workflow_id: Optional[int] = None,
-        show_dialog: bool = False
-    ) -> str:
-        """
-        Handle workflow-specific errors.
+    return handle_error(error, context, show_dialog)
+
+
+def handle_formula_error(
+    error: Exception,
+    formula: Optional[str] = None,
+    show_dialog: bool = False
+) -> str:
+    """
+    Handle formula-specific errors.
+    
+    Args:
+        error: The formula exception
+        formula: Optional formula expression that caused the error
+        show_dialog: Whether to show GUI dialog
         
-        Args:
-            error: The workflow exception
-            workflow_id: Optional workflow ID that caused the error
-            show_dialog: Whether to show GUI dialog
-            
-        Returns:
-            User-friendly error message
-        """
-        context = "Quy trình làm việc"
-        if workflow_id:
-            logger.error(f"Workflow error with ID: {workflow_id}")
+    Returns:
+        User-friendly error message
+    """
+    context = "Tính toán công thức"
+    if formula:
+        logger.error("Formula error with expression: %s", formula)
+    
+    return handle_error(error, context, show_dialog)
+
+
+def handle_workflow_error(
+    error: Exception,
+    workflow_id: Optional[int] = None,
+    show_dialog: bool = False
+) -> str:
+    """
+    Handle workflow-specific errors.
+    
+    Args:
+        error: The workflow exception
+        workflow_id: Optional workflow ID that caused the error
+        show_dialog: Whether to show GUI dialog
         
-        return ErrorHandler.handle_error(error, context, show_dialog)
+    Returns:
+        User-friendly error message
+    """
+    context = "Quy trình làm việc"
+    if workflow_id:
+        logger.error("Workflow error with ID: %s", workflow_id)
     
-    @staticmethod
-    def safe_execute(
-        func: Callable,
-        *args,
-        default_return: Any = None,
-        context: str = "",
-        show_dialog: bool = False,
-        **kwargs
-    ) -> Any:
-        """
-        Execute a function with error handling and recovery.
+    return handle_error(error, context, show_dialog)
+
+
+def safe_execute(
+    func: Callable,
+    *args,
+    default_return: Any = None,
+    context: str = "",
+    show_dialog: bool = False,
+    **kwargs
+) -> Any:
+    """
+    Execute a function with error handling and recovery.
+    
+    Args:
+        func: Function to execute
+        *args: Positional arguments for the function
+        default_return: Value to return if error occurs
+        context: Context description
+        show_dialog: Whether to show error dialog
+        **kwargs: Keyword arguments for the function
         
-        Args:
-            func: Function to execute
-            *args: Positional arguments for the function
-            default_return: Value to return if error occurs
-            context: Context description
-            show_dialog: Whether to show error dialog
-            **kwargs: Keyword arguments for the function
-            
-        Returns:
-            Function result or default_return if error occurs
-        """
-        try:
-            return func(*args, **kwargs)
-        except Exception as e:
-            ErrorHandler.handle_error(e, context or func.__name__, show_dialog)
-            return default_return
+    Returns:
+        Function result or default_return if error occurs
+    """
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        handle_error(e, context or func.__name__, show_dialog)
+        return default_return
+
+
+class ErrorHandler:
+    """
+    Centralized error handling with logging and user-friendly messages.
+    
+    Provides methods to handle different types of errors consistently
+    across the application.
+    """
+    
+    # Error message templates (read-only view of each exception's `friendly`)
+    ERROR_MESSAGES = MappingProxyType({
+        **{cls: cls.friendly for cls in (
+            ValidationError, DatabaseError, FormulaError, WorkflowError,
+            ConfigurationError, ImportExportError, TransportConnectionError
+        )},
+        Exception: "Lỗi không xác định"
+    })
+    
+    # The handlers are module-level functions; these aliases keep the
+    # ErrorHandler.handle_* API
+    handle_error = staticmethod(handle_error)
+    handle_validation_error = staticmethod(handle_validation_error)
+    handle_database_error = staticmethod(handle_database_error)
+    handle_formula_error = staticmethod(handle_formula_error)
+    handle_workflow_error = staticmethod(handle_workflow_error)
+    safe_execute = staticmethod(safe_execute)
+
+
+_DEFAULT_ERROR_MSG = ErrorHandler.ERROR_MESSAGES[Exception]
 
 
 # ============================================================================
@@ -313,7 +359,7 @@ def handle_errors(
                 return func(*args, **kwargs)
             except Exception as e:
                 error_context = context or f"Function: {func.__name__}"
-                ErrorHandler.handle_error(e, error_context, show_dialog, reraise)
+                handle_error(e, error_context, show_dialog, reraise)
                 return default_return
         return wrapper
     return decorator
@@ -346,7 +392,7 @@ def validate_input(validation_func: Callable[[Any], tuple[bool, list[str]]]):
             is_valid, errors = validation_func(*args, **kwargs)
             
             if not is_valid:
-                error_msg = ErrorHandler.handle_validation_error(errors)
+                error_msg = handle_validation_error(errors)
                 raise ValidationError(error_msg)
             
             return func(*args, **kwargs)
@@ -368,7 +414,8 @@ class ErrorRecovery:
         func: Callable,
         max_retries: int = 3,
         delay: float = 1.0,
-        exceptions: tuple = (Exception,)
+        exceptions: tuple = (Exception,),
+        max_delay: Optional[float] = None
     ) -> Any:
         """
         Retry a function on error with exponential backoff.
@@ -378,6 +425,7 @@ class ErrorRecovery:
             max_retries: Maximum number of retry attempts
             delay: Initial delay between retries (seconds)
             exceptions: Tuple of exceptions to catch and retry
+            max_delay: Upper bound for the backoff delay (seconds, optional)
             
         Returns:
             Function result
@@ -385,8 +433,6 @@ class ErrorRecovery:
         Raises:
             Last exception if all retries fail
         """
-        import time
-        
         last_exception = None
         current_delay = delay
         
@@ -395,16 +441,16 @@ class ErrorRecovery:
                 return func()
             except exceptions as e:
                 last_exception = e
-                logger.warning(
-                    f"Attempt {attempt + 1}/{max_retries} failed: {str(e)}"
-                )
+                logger.warning("Attempt %d/%d failed: %s", attempt + 1, max_retries, e)
                 
                 if attempt < max_retries - 1:
                     time.sleep(current_delay)
                     current_delay *= 2  # Exponential backoff
+                    if max_delay is not None and current_delay > max_delay:
+                        current_delay = max_delay
         
         # All retries failed
-        logger.error(f"All {max_retries} retry attempts failed")
+        logger.error("All %d retry attempts failed", max_retries)
         raise last_exception
     
     @staticmethod
@@ -427,9 +473,7 @@ class ErrorRecovery:
         try:
             return primary_func()
         except exceptions as e:
-            logger.warning(
-                f"Primary function failed: {str(e)}, using fallback"
-            )
+            logger.warning("Primary function failed: %s, using fallback", e)
             return fallback_func()
     
     @staticmethod
@@ -459,7 +503,7 @@ class ErrorRecovery:
             connection.commit()
             return result
         except Exception as e:
-            logger.error(f"Transaction failed, rolling back: {str(e)}")
+            logger.error("Transaction failed, rolling back: %s", e)
             connection.rollback()
             raise DatabaseError(f"Transaction failed: {str(e)}")
 
@@ -468,20 +512,26 @@ class ErrorRecovery:
 # Utility Functions
 # ============================================================================
 
-def get_error_details(error: Exception) -> dict:
+def get_error_details(error: Exception, include_tb: bool = False) -> dict:
     """
     Extract detailed information from an exception.
     
     Args:
         error: The exception to analyze
+        include_tb: Also format the error's traceback (None otherwise,
+                    or when the error was never raised)
         
     Returns:
         Dictionary with error details
     """
+    tb_text = None
+    if include_tb and error.__traceback__ is not None:
+        tb_text = ''.join(traceback.format_exception(type(error), error, error.__traceback__))
+    
     return {
         'type': type(error).__name__,
         'message': str(error),
-        'traceback': traceback.format_exc(),
+        'traceback': tb_text,
         'args': error.args
     }
 
@@ -496,10 +546,5 @@ def format_error_for_user(error: Exception) -> str:
     Returns:
         User-friendly error message
     """
-    error_type = type(error)
-    template = ErrorHandler.ERROR_MESSAGES.get(
-        error_type,
-        ErrorHandler.ERROR_MESSAGES[Exception]
-    )
-    
-    return f"{template}: {str(error)}"
+    template = getattr(type(error), 'friendly', _DEFAULT_ERROR_MSG)
+    return f"{template}: {error}"
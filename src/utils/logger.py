@@ -10,40 +10,94 @@ Provides comprehensive logging with:
 Requirements: 17.2
 """
 
+import atexit
 import logging
+import queue
 import sys
+import threading
 import time
 import json
-from logging.handlers import RotatingFileHandler
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Optional, Dict, Any
-from functools import wraps
+from functools import lru_cache, wraps
 from contextlib import contextmanager
+from operator import attrgetter
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib encoder
+    orjson = None
 
 import config
 
 
+def _dumps_log_data(log_data: Dict[str, Any]) -> str:
+    """
+    Serialize a structured log entry, using orjson when available.
+    
+    Values JSON cannot represent (Decimal, Path, ...) are written with str()
+    instead of failing the whole record; both encoders emit compact JSON.
+    """
+    if orjson is not None:
+        return orjson.dumps(log_data, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(log_data, ensure_ascii=False, separators=(',', ':'), default=str)
+
+
 # ============================================================================
-# Structured Logging Formatter
+# Formatters
 # ============================================================================
 
+class FastFormatter(logging.Formatter):
+    """
+    Formatter that formats the timestamp at most once per second.
+    
+    Consecutive records logged within the same second reuse the cached
+    strftime result; milliseconds are still appended per record when no
+    datefmt is given.
+    """
+    
+    def __init__(self, fmt: Optional[str] = None, datefmt: Optional[str] = None, style: str = '%'):
+        super().__init__(fmt, datefmt, style)
+        self._last_sec: Optional[int] = None
+        self._last_asctime = ""
+    
+    def formatTime(self, record: logging.LogRecord, datefmt: Optional[str] = None) -> str:
+        """Format record.created, reusing the string for the current second"""
+        sec = int(record.created)
+        if sec != self._last_sec:
+            self._last_asctime = time.strftime(
+                datefmt or self.default_time_format, self.converter(sec)
+            )
+            self._last_sec = sec
+        if datefmt:
+            return self._last_asctime
+        return self.default_msec_format % (self._last_asctime, record.msecs)
+
+
 class StructuredFormatter(logging.Formatter):
     """
     Formatter that outputs structured log data in JSON format.
     Useful for log aggregation and analysis tools.
     """
     
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Output keys and their getters are fixed, so build them once here
+        # and only pull the values off each record in format()
+        self._schema = (
+            ('timestamp', lambda r: self.formatTime(r, self.datefmt)),
+            ('level', attrgetter('levelname')),
+            ('logger', attrgetter('name')),
+            ('module', attrgetter('module')),
+            ('function', attrgetter('funcName')),
+            ('line', attrgetter('lineno')),
+            ('message', logging.LogRecord.getMessage),
+        )
+    
     def format(self, record: logging.LogRecord) -> str:
         """Format log record as JSON structure"""
-        log_data = {
-            'timestamp': self.formatTime(record, self.datefmt),
-            'level': record.levelname,
-            'logger': record.name,
-            'module': record.module,
-            'function': record.funcName,
-            'line': record.lineno,
-            'message': record.getMessage(),
-        }
+        log_data = {key: getter(record) for key, getter in self._schema}
         
         # Add exception info if present
         if record.exc_info:
@@ -53,13 +107,19 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, 'extra_data'):
             log_data['extra'] = record.extra_data
         
-        return json.dumps(log_data, ensure_ascii=False)
+        return _dumps_log_data(log_data)
 
 
 # ============================================================================
 # Performance Logging
 # ============================================================================
 
+@lru_cache(maxsize=1024)
+def _query_preview(query: str) -> str:
+    """Truncate long queries for logging (memoized, SQL text repeats a lot)"""
+    return query[:100] + "..." if len(query) > 100 else query
+
+
 class PerformanceLogger:
     """
     Logger for tracking performance metrics.
@@ -82,7 +142,10 @@ class PerformanceLogger:
             duration: Duration in seconds
             details: Additional details about the operation
         """
-        message = f"Performance: {operation} took {duration:.4f}s"
+        # Log as INFO if fast, WARNING if slow
+        level = logging.WARNING if duration > 1.0 else logging.INFO
+        if not self.logger.isEnabledFor(level):
+            return
         
         extra_data = {
             'operation': operation,
@@ -93,11 +156,10 @@ class PerformanceLogger:
         if details:
             extra_data.update(details)
         
-        # Log as INFO if fast, WARNING if slow
-        if duration > 1.0:
-            self.logger.warning(message, extra={'extra_data': extra_data})
-        else:
-            self.logger.info(message, extra={'extra_data': extra_data})
+        self.logger.log(
+            level, "Performance: %s took %.4fs", operation, duration,
+            extra={'extra_data': extra_data}
+        )
     
     def log_query(
         self,
@@ -113,8 +175,7 @@ class PerformanceLogger:
             duration: Query duration in seconds
             row_count: Number of rows returned/affected
         """
-        # Truncate long queries
-        query_preview = query[:100] + "..." if len(query) > 100 else query
+        query_preview = _query_preview(query)
         
         details = {
             'query_preview': query_preview,
@@ -149,6 +210,86 @@ class PerformanceLogger:
 # Setup Functions
 # ============================================================================
 
+# Startup banner, logged once by setup_logging as one multi-line record
+STARTUP_BANNER = "\n".join((
+    "=" * 80,
+    "Transport Management System - Logging initialized",
+    "Log level: %s",
+    "Log file: %s",
+    "Structured logging: %s",
+    "Performance logging: %s",
+    "=" * 80,
+))
+
+# Background listener that owns the file/console handlers (see setup_logging)
+_queue_listener: Optional[QueueListener] = None
+
+# File writes are buffered up to this many records or seconds
+LOG_BUFFER_CAPACITY = 512
+LOG_FLUSH_INTERVAL = 30.0
+
+
+class BufferedFileHandler(MemoryHandler):
+    """
+    MemoryHandler that also flushes once the buffer is older than an interval.
+    
+    Records reach the target handler in batches instead of one write and
+    flush per record; ERROR and above are written immediately. A daemon
+    thread flushes on the interval even when no new records arrive, so a
+    quiet app does not keep its last records in memory.
+    """
+    
+    def __init__(self, target: logging.Handler, capacity: int = LOG_BUFFER_CAPACITY,
+                 flush_interval: float = LOG_FLUSH_INTERVAL):
+        super().__init__(capacity, flushLevel=logging.ERROR, target=target, flushOnClose=True)
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        self._stop_flusher = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="BufferedFileHandlerFlusher", daemon=True
+        )
+        self._flusher.start()
+    
+    def _flush_periodically(self):
+        """Flush a non-empty buffer whenever the interval elapses"""
+        while not self._stop_flusher.wait(self.flush_interval):
+            if self.buffer and time.monotonic() - self._last_flush >= self.flush_interval:
+                self.flush()
+    
+    def shouldFlush(self, record: logging.LogRecord) -> bool:
+        """Flush when full, on ERROR+ records, or when the interval elapsed"""
+        return (
+            super().shouldFlush(record)
+            or time.monotonic() - self._last_flush >= self.flush_interval
+        )
+    
+    def flush(self):
+        """Write buffered records to the target handler"""
+        super().flush()
+        self._last_flush = time.monotonic()
+    
+    def close(self):
+        """Stop the flush thread, then flush and close as MemoryHandler does"""
+        self._stop_flusher.set()
+        if self._flusher is not threading.current_thread():
+            self._flusher.join()
+        super().close()
+
+
+class RecordQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records without formatting them.
+    
+    The stock prepare() renders the message and traceback on the logging
+    thread and drops exc_info; here the listener thread does all the
+    formatting, and StructuredFormatter still sees exc_info.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return the record unchanged, with args and exc_info intact"""
+        return record
+
+
 def setup_logging(
     enable_structured: bool = False,
     enable_performance: bool = True
@@ -183,12 +324,12 @@ def setup_logging(
             datefmt="%Y-%m-%d %H:%M:%S"
         )
     else:
-        file_formatter = logging.Formatter(
+        file_formatter = FastFormatter(
             "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
         )
 
-    console_formatter = logging.Formatter(
+    console_formatter = FastFormatter(
         "%(levelname)s - %(message)s"
     )
 
@@ -207,26 +348,62 @@ def setup_logging(
     console_handler.setLevel(logging.INFO)
     console_handler.setFormatter(console_formatter)
 
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Formatting and disk/console writes run on a listener thread; the
+    # logger itself only enqueues records, so the GUI thread never blocks on I/O
+    global _queue_listener
+    log_queue = queue.SimpleQueue()
+    buffered_file_handler = BufferedFileHandler(file_handler)
+    buffered_file_handler.setLevel(logging.DEBUG)
+    _queue_listener = QueueListener(
+        log_queue, buffered_file_handler, console_handler, respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(shutdown_logging)
+    
+    logger.addHandler(RecordQueueHandler(log_queue))
     
-    # Log startup
-    logger.info("=" * 80)
-    logger.info(f"Transport Management System - Logging initialized")
-    logger.info(f"Log level: {config.LOG_LEVEL}")
-    logger.info(f"Log file: {config.LOG_FILE}")
-    logger.info(f"Structured logging: {enable_structured}")
-    logger.info(f"Performance logging: {enable_performance}")
-    logger.info("=" * 80)
+    # Log startup as a single record
+    logger.info(
+        STARTUP_BANNER,
+        config.LOG_LEVEL, config.LOG_FILE, enable_structured, enable_performance
+    )
 
     return logger
 
 
+def shutdown_logging():
+    """
+    Stop the background log listener, writing out any queued records.
+    
+    Registered with atexit by setup_logging; safe to call more than once.
+    Calling setup_logging afterwards starts a fresh listener.
+    """
+    global _queue_listener
+    if _queue_listener is None:
+        return
+    
+    logger = logging.getLogger("TransportApp")
+    for handler in list(logger.handlers):
+        if isinstance(handler, QueueHandler):
+            logger.removeHandler(handler)
+    
+    _queue_listener.stop()
+    for handler in _queue_listener.handlers:
+        target = handler.target if isinstance(handler, MemoryHandler) else None
+        handler.close()  # a MemoryHandler flushes its buffer here
+        if target is not None:
+            target.close()
+    _queue_listener = None
+
+
+@lru_cache(maxsize=256)
 def get_logger(name: str = None) -> logging.Logger:
     """
     Get a logger instance.
     
+    Loggers live for the whole process in the logging module, so results
+    are memoized per name.
+    
     Args:
         name: Logger name (optional)
     
@@ -269,24 +446,24 @@ def log_function_call(logger: Optional[logging.Logger] = None):
             return arg1 + arg2
     """
     def decorator(func):
+        log = logger or get_logger(func.__module__)
+        name = func.__name__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            log = logger or get_logger(func.__module__)
-            
-            # Log function call
-            log.debug(
-                f"Calling {func.__name__} with args={args}, kwargs={kwargs}"
-            )
+            # Levels can change at runtime, so check per call; repr() of large
+            # arguments is skipped entirely when DEBUG is off
+            debug = log.isEnabledFor(logging.DEBUG)
+            if debug:
+                log.debug("Calling %s with args=%s, kwargs=%s", name, args, kwargs)
             
             try:
                 result = func(*args, **kwargs)
-                log.debug(f"{func.__name__} returned: {result}")
+                if debug:
+                    log.debug("%s returned: %s", name, result)
                 return result
             except Exception as e:
-                log.error(
-                    f"{func.__name__} raised {type(e).__name__}: {str(e)}",
-                    exc_info=True
-                )
+                log.error("%s raised %s: %s", name, type(e).__name__, e, exc_info=config.LOG_EXC_INFO)
                 raise
         
         return wrapper
@@ -311,25 +488,30 @@ def log_performance(
             pass
     """
     def decorator(func):
+        log = logger or get_logger(func.__module__)
+        perf_logger = PerformanceLogger(log)
+        op_name = operation_name or func.__name__
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
-            log = logger or get_logger(func.__module__)
-            perf_logger = PerformanceLogger(log)
+            # Timings are logged at INFO (slow ones at WARNING); when neither
+            # level is enabled only failures can be logged, so skip the timing
+            if not log.isEnabledFor(logging.WARNING):
+                try:
+                    return func(*args, **kwargs)
+                except Exception as e:
+                    log.error("%s failed: %s", op_name, e, exc_info=config.LOG_EXC_INFO)
+                    raise
             
-            op_name = operation_name or func.__name__
-            
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                duration = time.time() - start_time
+                duration = (time.perf_counter_ns() - start_ns) * 1e-9
                 perf_logger.log_operation(op_name, duration)
                 return result
             except Exception as e:
-                duration = time.time() - start_time
-                log.error(
-                    f"{op_name} failed after {duration:.4f}s: {str(e)}",
-                    exc_info=True
-                )
+                duration = (time.perf_counter_ns() - start_ns) * 1e-9
+                log.error("%s failed after %.4fs: %s", op_name, duration, e, exc_info=config.LOG_EXC_INFO)
                 raise
         
         return wrapper
@@ -357,11 +539,11 @@ def log_context(
     log = logger or get_logger()
     
     log.info(f"Starting: {operation}")
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     
     try:
         yield
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_ns) * 1e-9
         
         if log_performance:
             perf_logger = PerformanceLogger(log)
@@ -370,7 +552,7 @@ def log_context(
             log.info(f"Completed: {operation} ({duration:.4f}s)")
     
     except Exception as e:
-        duration = time.time() - start_time
+        duration = (time.perf_counter_ns() - start_ns) * 1e-9
         log.error(
             f"Failed: {operation} after {duration:.4f}s - {str(e)}",
             exc_info=True
@@ -389,16 +571,24 @@ def log_system_info(logger: Optional[logging.Logger] = None):
     Args:
         logger: Logger instance (optional)
     """
-    import platform
-    import sys
-    
     log = logger or get_logger()
     
     log.info("System Information:")
-    log.info(f"  Platform: {platform.platform()}")
-    log.info(f"  Python: {sys.version}")
-    log.info(f"  Architecture: {platform.machine()}")
-    log.info(f"  Processor: {platform.processor()}")
+    for label, value in _system_info():
+        log.info("  %s: %s", label, value)
+
+
+@lru_cache(maxsize=1)
+def _system_info() -> tuple:
+    """Collect system information once; platform lookups may spawn processes"""
+    import platform
+    
+    return (
+        ("Platform", platform.platform()),
+        ("Python", sys.version),
+        ("Architecture", platform.machine()),
+        ("Processor", platform.processor()),
+    )
 
 
 def set_log_level(level: str, logger: Optional[logging.Logger] = None):
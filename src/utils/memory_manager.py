@@ -4,12 +4,16 @@ Provides memory management utilities including cleanup, cache limits, and garbag
 """
 
 import gc
+import heapq
 import logging
 import psutil
 import os
-from typing import Optional, Dict, Any, List
+import threading
+import time
+from weakref import WeakSet
+from typing import Callable, Optional, Dict, Any
 from PyQt6.QtWidgets import QTableWidget, QWidget
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QSignalBlocker, QTimer
 
 
 logger = logging.getLogger(__name__)
@@ -18,10 +22,18 @@ logger = logging.getLogger(__name__)
 class MemoryMonitor:
     """Monitor memory usage of the application"""
     
-    def __init__(self):
-        """Initialize memory monitor"""
+    def __init__(self, stats_ttl: float = 1.0):
+        """
+        Initialize memory monitor
+        
+        Args:
+            stats_ttl: Seconds a get_memory_stats() snapshot is reused
+        """
         self.process = psutil.Process(os.getpid())
         self.baseline_memory = self.get_current_memory()
+        self.stats_ttl = stats_ttl
+        self._stats_cache: Optional[Dict[str, Any]] = None
+        self._stats_cache_ts = 0.0
     
     def get_current_memory(self) -> float:
         """
@@ -62,23 +74,39 @@ class MemoryMonitor:
     def reset_baseline(self):
         """Reset baseline memory measurement"""
         self.baseline_memory = self.get_current_memory()
+        self._stats_cache = None
     
     def get_memory_stats(self) -> Dict[str, Any]:
         """
         Get comprehensive memory statistics
         
+        Bursts of reports within stats_ttl seconds share one snapshot.
+        
         Returns:
             Dictionary with memory stats
         """
-        current = self.get_current_memory()
-        return {
-            'current_mb': round(current, 2),
-            'baseline_mb': round(self.baseline_memory, 2),
-            'delta_mb': round(current - self.baseline_memory, 2),
-            'percent': round(self.get_memory_percent(), 2),
-            'available_mb': round(psutil.virtual_memory().available / 1024 / 1024, 2),
-            'total_mb': round(psutil.virtual_memory().total / 1024 / 1024, 2)
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache_ts < self.stats_ttl:
+            return dict(self._stats_cache)
+        
+        # oneshot() lets psutil read the process info once for both values
+        with self.process.oneshot():
+            current = self.get_current_memory()
+            percent = self.get_memory_percent()
+        system_memory = psutil.virtual_memory()
+        
+        # Values are left unrounded; callers format them where they are shown
+        stats = {
+            'current_mb': current,
+            'baseline_mb': self.baseline_memory,
+            'delta_mb': current - self.baseline_memory,
+            'percent': percent,
+            'available_mb': system_memory.available / 1024 / 1024,
+            'total_mb': system_memory.total / 1024 / 1024
         }
+        self._stats_cache = stats
+        self._stats_cache_ts = now
+        return dict(stats)
 
 
 class CacheLimitManager:
@@ -94,6 +122,8 @@ class CacheLimitManager:
         self.max_cache_size_mb = max_cache_size_mb
         self.caches: Dict[str, Any] = {}
         self.cache_sizes: Dict[str, float] = {}
+        # Running sum of cache_sizes, kept in step by register/unregister/clear
+        self._total_size = 0.0
     
     def register_cache(self, cache_id: str, cache_obj: Any, estimated_size_mb: float = 0.0):
         """
@@ -105,6 +135,7 @@ class CacheLimitManager:
             estimated_size_mb: Estimated size in MB
         """
         self.caches[cache_id] = cache_obj
+        self._total_size += estimated_size_mb - self.cache_sizes.get(cache_id, 0.0)
         self.cache_sizes[cache_id] = estimated_size_mb
         logger.debug(f"Registered cache: {cache_id} ({estimated_size_mb:.2f} MB)")
     
@@ -117,7 +148,7 @@ class CacheLimitManager:
         """
         if cache_id in self.caches:
             del self.caches[cache_id]
-            del self.cache_sizes[cache_id]
+            self._total_size -= self.cache_sizes.pop(cache_id)
             logger.debug(f"Unregistered cache: {cache_id}")
     
     def get_total_cache_size(self) -> float:
@@ -127,7 +158,7 @@ class CacheLimitManager:
         Returns:
             Total size in MB
         """
-        return sum(self.cache_sizes.values())
+        return self._total_size
     
     def clear_cache(self, cache_id: str):
         """
@@ -140,6 +171,7 @@ class CacheLimitManager:
             cache = self.caches[cache_id]
             if hasattr(cache, 'clear'):
                 cache.clear()
+                self._total_size -= self.cache_sizes[cache_id]
                 self.cache_sizes[cache_id] = 0.0
                 logger.info(f"Cleared cache: {cache_id}")
     
@@ -156,38 +188,41 @@ class CacheLimitManager:
         if total_size > self.max_cache_size_mb:
             logger.warning(f"Cache size ({total_size:.2f} MB) exceeds limit ({self.max_cache_size_mb:.2f} MB)")
             
-            # Sort caches by size (largest first)
-            sorted_caches = sorted(
-                self.cache_sizes.items(),
-                key=lambda x: x[1],
-                reverse=True
-            )
+            # Max-heap of caches by size (largest cleared first)
+            heap = [(-size, cache_id) for cache_id, size in self.cache_sizes.items()]
+            heapq.heapify(heap)
             
             # Clear caches until under limit
-            for cache_id, size in sorted_caches:
-                if self.get_total_cache_size() <= self.max_cache_size_mb:
-                    break
+            while heap and self._total_size > self.max_cache_size_mb:
+                _, cache_id = heapq.heappop(heap)
                 self.clear_cache(cache_id)
     
     def get_cache_stats(self) -> Dict[str, Any]:
         """
-        Get cache statistics
+        Get summary cache statistics (constant time, for health checks)
         
         Returns:
-            Dictionary with cache stats
+            Dictionary with cache count, total size and utilization
         """
         return {
             'total_caches': len(self.caches),
-            'total_size_mb': round(self.get_total_cache_size(), 2),
+            'total_size_mb': self._total_size,
             'max_size_mb': self.max_cache_size_mb,
-            'utilization_percent': round(
-                (self.get_total_cache_size() / self.max_cache_size_mb * 100), 2
-            ) if self.max_cache_size_mb > 0 else 0,
-            'caches': {
-                cache_id: round(size, 2)
-                for cache_id, size in self.cache_sizes.items()
-            }
+            'utilization_percent': (
+                self._total_size / self.max_cache_size_mb * 100
+            ) if self.max_cache_size_mb > 0 else 0
         }
+    
+    def get_cache_detail(self) -> Dict[str, Any]:
+        """
+        Get cache statistics including the size of every registered cache
+        
+        Returns:
+            Summary statistics plus a 'caches' mapping of cache ID to size
+        """
+        stats = self.get_cache_stats()
+        stats['caches'] = dict(self.cache_sizes)
+        return stats
 
 
 class TableMemoryOptimizer:
@@ -228,10 +263,10 @@ class TableMemoryOptimizer:
             current_rows = table.rowCount()
             
             if current_rows > max_rows:
-                # Remove excess rows from the end
+                # Drop excess rows from the end in one model change
                 rows_to_remove = current_rows - max_rows
-                for _ in range(rows_to_remove):
-                    table.removeRow(table.rowCount() - 1)
+                with QSignalBlocker(table):
+                    table.setRowCount(max_rows)
                 
                 logger.info(f"Removed {rows_to_remove} rows from table to optimize memory")
         except Exception as e:
@@ -277,6 +312,7 @@ class GarbageCollectionManager:
         self.collect_interval_ms = collect_interval_ms
         self.timer: Optional[QTimer] = None
         self.collection_count = 0
+        self.frozen = False
         
         if auto_collect:
             self._start_auto_collection()
@@ -300,12 +336,8 @@ class GarbageCollectionManager:
         # Get counts before collection
         before_counts = gc.get_count()
         
-        # Collect all generations
-        collected = {
-            'gen0': gc.collect(0),
-            'gen1': gc.collect(1),
-            'gen2': gc.collect(2)
-        }
+        # A full collection already includes the younger generations
+        total_collected = gc.collect()
         
         # Get counts after collection
         after_counts = gc.get_count()
@@ -313,23 +345,39 @@ class GarbageCollectionManager:
         self.collection_count += 1
         
         logger.info(
-            f"Garbage collection #{self.collection_count} completed: "
-            f"collected {sum(collected.values())} objects"
+            "Garbage collection #%d completed: collected %d objects",
+            self.collection_count, total_collected
         )
         
         return {
-            'collected': collected,
+            'collected': {'all': total_collected},
             'before_counts': before_counts,
             'after_counts': after_counts,
-            'total_collected': sum(collected.values())
+            'total_collected': total_collected
         }
     
+    def freeze_startup_objects(self):
+        """
+        Move everything alive now into the permanent generation
+        
+        Call once after startup (main window built): modules, config and the
+        static widget tree are then skipped by every later collection.
+        """
+        gc.collect()
+        gc.freeze()
+        self.frozen = True
+        logger.info("Froze %d startup objects", gc.get_freeze_count())
+    
     def stop_auto_collection(self):
-        """Stop automatic garbage collection"""
+        """Stop automatic garbage collection and unfreeze frozen objects"""
         if self.timer:
             self.timer.stop()
             self.timer = None
             logger.info("Stopped automatic garbage collection")
+        
+        if self.frozen:
+            gc.unfreeze()
+            self.frozen = False
     
     def get_gc_stats(self) -> Dict[str, Any]:
         """
@@ -343,6 +391,7 @@ class GarbageCollectionManager:
             'counts': gc.get_count(),
             'thresholds': gc.get_threshold(),
             'collection_count': self.collection_count,
+            'frozen_objects': gc.get_freeze_count(),
             'auto_collect': self.auto_collect
         }
 
@@ -368,7 +417,18 @@ class MemoryManager:
         self.cache_manager = CacheLimitManager(max_cache_size_mb)
         self.gc_manager = GarbageCollectionManager(auto_gc, gc_interval_ms)
         self.table_optimizer = TableMemoryOptimizer()
-        self.widgets_to_cleanup: List[QWidget] = []
+        # Weak references: a registered widget that is dropped elsewhere is not kept alive here
+        self.widgets_to_cleanup: WeakSet = WeakSet()
+        
+        # Widget-specific cleanup keyed by widget class (exact type first,
+        # then isinstance for subclasses)
+        self._cleanup_dispatch: Dict[type, Callable[[QWidget], None]] = {
+            QTableWidget: self.table_optimizer.clear_table,
+        }
+    
+    def freeze_startup_objects(self):
+        """Freeze long-lived startup objects so periodic GC skips them"""
+        self.gc_manager.freeze_startup_objects()
     
     def register_widget_for_cleanup(self, widget: QWidget):
         """
@@ -377,7 +437,7 @@ class MemoryManager:
         Args:
             widget: Widget to cleanup
         """
-        self.widgets_to_cleanup.append(widget)
+        self.widgets_to_cleanup.add(widget)
     
     def cleanup_widget(self, widget: QWidget):
         """
@@ -387,21 +447,42 @@ class MemoryManager:
             widget: Widget to cleanup
         """
         try:
-            # If it's a table, clear it
-            if isinstance(widget, QTableWidget):
-                self.table_optimizer.clear_table(widget)
+            # Run the widget-specific cleanup (e.g. clear tables)
+            cleanup = self._get_widget_cleanup(type(widget))
+            if cleanup is not None:
+                cleanup(widget)
             
             # Delete later
             widget.deleteLater()
             
             # Remove from tracking
-            if widget in self.widgets_to_cleanup:
-                self.widgets_to_cleanup.remove(widget)
+            self.widgets_to_cleanup.discard(widget)
             
             logger.debug(f"Cleaned up widget: {widget.__class__.__name__}")
         except Exception as e:
             logger.error(f"Failed to cleanup widget: {e}")
     
+    def _get_widget_cleanup(self, widget_type: type) -> Optional[Callable[[QWidget], None]]:
+        """
+        Find the cleanup function for a widget class
+        
+        Args:
+            widget_type: Widget class
+            
+        Returns:
+            Cleanup function or None if the widget needs no special cleanup
+        """
+        cleanup = self._cleanup_dispatch.get(widget_type)
+        if cleanup is None:
+            for cls, fn in self._cleanup_dispatch.items():
+                if issubclass(widget_type, cls):
+                    cleanup = fn
+                    break
+            if cleanup is not None:
+                # Remember the subclass so later lookups hit directly
+                self._cleanup_dispatch[widget_type] = cleanup
+        return cleanup
+    
     def cleanup_all_widgets(self):
         """Cleanup all registered widgets"""
         for widget in list(self.widgets_to_cleanup):
@@ -431,7 +512,7 @@ class MemoryManager:
         """
         return {
             'memory': self.monitor.get_memory_stats(),
-            'cache': self.cache_manager.get_cache_stats(),
+            'cache': self.cache_manager.get_cache_detail(),
             'gc': self.gc_manager.get_gc_stats()
         }
     
@@ -486,6 +567,7 @@ class MemoryManager:
 
 # Global memory manager instance
 _memory_manager: Optional[MemoryManager] = None
+_memory_manager_lock = threading.Lock()
 
 
 def get_memory_manager(
@@ -495,14 +577,21 @@ def get_memory_manager(
 ) -> MemoryManager:
     """Get or create global memory manager instance"""
     global _memory_manager
-    if _memory_manager is None:
-        _memory_manager = MemoryManager(max_cache_size_mb, auto_gc, gc_interval_ms)
-    return _memory_manager
+    manager = _memory_manager
+    if manager is None:
+        # Only creation takes the lock; re-check so two threads racing
+        # past the first test cannot both build a manager
+        with _memory_manager_lock:
+            if _memory_manager is None:
+                _memory_manager = MemoryManager(max_cache_size_mb, auto_gc, gc_interval_ms)
+            manager = _memory_manager
+    return manager
 
 
 def reset_memory_manager():
     """Reset global memory manager instance"""
     global _memory_manager
-    if _memory_manager:
-        _memory_manager.shutdown()
-    _memory_manager = None
+    with _memory_manager_lock:
+        manager, _memory_manager = _memory_manager, None
+    if manager:
+        manager.shutdown()
@@ -10,19 +10,138 @@ Provides comprehensive number handling utilities including:
 Requirements: 18.2
 """
 
-from typing import Optional, Union
+from functools import lru_cache
+from math import floor
+from typing import Any, Optional, Sequence, Union
 from decimal import Decimal, ROUND_HALF_UP, InvalidOperation
-import re
+
+
+# Currency settings
+CURRENCY_SYMBOL = "₫"
+CURRENCY_SYMBOL_VND = "VND"
+THOUSAND_SEPARATOR = ","
+DECIMAL_SEPARATOR = "."
+
+# Separator rewrites used by parse_number, each a single pass over the string
+_STRIP_COMMAS = str.maketrans("", "", ",")
+_STRIP_DOTS = str.maketrans("", "", ".")
+_EU_TO_US = str.maketrans({".": None, ",": "."})
+
+# Python's "," format spec already emits the default separator, so output
+# only needs rewriting when THOUSAND_SEPARATOR is changed
+_NEEDS_TSEP_REWRITE = THOUSAND_SEPARATOR != ","
+_TSEP_TRANS = str.maketrans({",": THOUSAND_SEPARATOR}) if _NEEDS_TSEP_REWRITE else None
+
+# Whole amounts can skip the generic path while the settings match the
+# f"{whole:,} ₫" shortcut in format_currency
+_USE_FAST_VND = not _NEEDS_TSEP_REWRITE and CURRENCY_SYMBOL == "₫"
+
+
+def parse_number(value: str) -> Optional[float]:
+    """
+    Parse number string to float, handling thousand separators
+    
+    Args:
+        value: String to parse
+        
+    Returns:
+        Parsed number or None if invalid
+        
+    Examples:
+        >>> parse_number("1,000,000")
+        1000000.0
+        >>> parse_number("1.234,56")
+        1234.56
+    """
+    if not value or not isinstance(value, str):
+        return None
+    return _parse_number_cached(value)
+
+
+@lru_cache(maxsize=4096)
+def _parse_number_cached(value: str) -> Optional[float]:
+    """Parse a non-empty number string (memoized, UI validators repeat values)"""
+    cleaned = value.strip()
+    
+    # Plain digit strings with at most one decimal point need no cleanup
+    int_part, _, frac_part = cleaned.partition(".")
+    if int_part.isdecimal() and (not frac_part or frac_part.isdecimal()):
+        return float(cleaned)
+    
+    # Remove currency symbols
+    cleaned = cleaned.replace(CURRENCY_SYMBOL, "")
+    cleaned = cleaned.replace(CURRENCY_SYMBOL_VND, "")
+    cleaned = cleaned.strip()
+    
+    # Handle different formats
+    # Format 1: 1,000,000.50 (US format)
+    # Format 2: 1.000.000,50 (EU format)
+    
+    # Locate separators; find() != rfind() means there is more than one
+    last_comma_pos = cleaned.rfind(",")
+    last_dot_pos = cleaned.rfind(".")
+    
+    if last_comma_pos >= 0 and last_dot_pos >= 0:
+        # Mixed separators - the last one is the decimal point
+        if last_comma_pos > last_dot_pos:
+            # EU format: 1.000.000,50
+            cleaned = cleaned.translate(_EU_TO_US)
+        else:
+            # US format: 1,000,000.50
+            cleaned = cleaned.translate(_STRIP_COMMAS)
+    elif last_comma_pos >= 0:
+        if cleaned.find(",") != last_comma_pos:
+            # Multiple commas - thousand separator
+            cleaned = cleaned.translate(_STRIP_COMMAS)
+        elif len(cleaned) - last_comma_pos <= 3:
+            # Single comma followed by at most two digits - decimal: 1000,50
+            cleaned = cleaned.replace(",", ".")
+        else:
+            # Single comma - thousand: 1,000
+            cleaned = cleaned.translate(_STRIP_COMMAS)
+    elif last_dot_pos >= 0 and cleaned.find(".") != last_dot_pos:
+        # Multiple dots - thousand separator (EU)
+        cleaned = cleaned.translate(_STRIP_DOTS)
+    
+    try:
+        return float(cleaned)
+    except ValueError:
+        return None
+
+
+# Floats at or beyond 2**52 have no fractional part; leave them (and nan/inf,
+# which fail the range check) to the Decimal path and its error handling
+_FLOAT_INT_LIMIT = float(2 ** 52)
+
+# round_number quantizers for the usual decimal places (0 -> Decimal('1'))
+_QUANTIZERS = {places: Decimal(10) ** -places for places in range(7)}
+
+
+def _round_half_up(value: float) -> int:
+    """
+    Round a finite float to an integer, halves away from zero
+    
+    Matches Decimal(str(value)).quantize(Decimal('1'), ROUND_HALF_UP): a
+    float's shortest repr ends in exactly .5 only when the float itself does,
+    and magnitude - floor(magnitude) is computed exactly.
+    """
+    magnitude = abs(value)
+    whole = floor(magnitude)
+    if magnitude - whole >= 0.5:
+        whole += 1
+    return -whole if value < 0 else whole
 
 
 class NumberUtils:
     """Utility class for number operations"""
     
     # Currency settings
-    CURRENCY_SYMBOL = "₫"
-    CURRENCY_SYMBOL_VND = "VND"
-    THOUSAND_SEPARATOR = ","
-    DECIMAL_SEPARATOR = "."
+    CURRENCY_SYMBOL = CURRENCY_SYMBOL
+    CURRENCY_SYMBOL_VND = CURRENCY_SYMBOL_VND
+    THOUSAND_SEPARATOR = THOUSAND_SEPARATOR
+    DECIMAL_SEPARATOR = DECIMAL_SEPARATOR
+    
+    parse_number = staticmethod(parse_number)
     
     @staticmethod
     def format_currency(value: Union[int, float, Decimal], 
@@ -48,19 +167,28 @@ class NumberUtils:
         if value is None:
             return "0"
         
-        # Convert to float for formatting
-        try:
-            num_value = float(value)
-        except (ValueError, TypeError):
-            return "0"
+        if isinstance(value, int):
+            # Already whole; no float round trip (exact for large amounts)
+            whole = value
+        else:
+            # Convert to float for formatting
+            try:
+                num_value = float(value)
+            except (ValueError, TypeError):
+                return "0"
+            whole = int(num_value) if num_value.is_integer() else None
         
         # Format with thousand separators
-        if num_value == int(num_value):
+        if whole is not None:
             # Integer value
-            formatted = f"{int(num_value):,}".replace(",", NumberUtils.THOUSAND_SEPARATOR)
+            if include_symbol and symbol == CURRENCY_SYMBOL and _USE_FAST_VND:
+                return f"{whole:,} ₫"
+            formatted = f"{whole:,}"
         else:
             # Decimal value
-            formatted = f"{num_value:,.2f}".replace(",", NumberUtils.THOUSAND_SEPARATOR)
+            formatted = f"{num_value:,.2f}"
+        if _NEEDS_TSEP_REWRITE:
+            formatted = formatted.translate(_TSEP_TRANS)
         
         if include_symbol:
             return f"{formatted} {symbol}"
@@ -90,6 +218,15 @@ class NumberUtils:
         if value is None:
             return "0"
         
+        if decimal_places == 0 and isinstance(value, int):
+            # Whole number: format directly, no float or string round trip
+            if not use_separator:
+                return f"{value:d}"
+            formatted = f"{value:,}"
+            if _NEEDS_TSEP_REWRITE:
+                formatted = formatted.translate(_TSEP_TRANS)
+            return formatted
+        
         try:
             num_value = float(value)
         except (ValueError, TypeError):
@@ -106,80 +243,40 @@ class NumberUtils:
             integer_part = parts[0]
             
             # Add thousand separators to integer part
-            integer_part = f"{int(integer_part):,}".replace(",", NumberUtils.THOUSAND_SEPARATOR)
+            integer_part = f"{int(integer_part):,}"
+            if _NEEDS_TSEP_REWRITE:
+                integer_part = integer_part.translate(_TSEP_TRANS)
             
             if len(parts) > 1:
-                formatted = f"{integer_part}{NumberUtils.DECIMAL_SEPARATOR}{parts[1]}"
+                formatted = f"{integer_part}{DECIMAL_SEPARATOR}{parts[1]}"
             else:
                 formatted = integer_part
         
         return formatted
     
     @staticmethod
-    def parse_number(value: str) -> Optional[float]:
+    def parse_numbers_batch(values: Sequence[Optional[str]]) -> Any:
         """
-        Parse number string to float, handling thousand separators
+        Parse many number strings at once (bulk import)
+        
+        Uses the same rules as parse_number; its cache makes the repeated
+        values typical of an imported column cheap.
         
         Args:
-            value: String to parse
+            values: Strings to parse
             
         Returns:
-            Parsed number or None if invalid
-            
-        Examples:
-            >>> NumberUtils.parse_number("1,000,000")
-            1000000.0
-            >>> NumberUtils.parse_number("1.234,56")
-            1234.56
-        """
-        if not value or not isinstance(value, str):
-            return None
-        
-        # Remove whitespace and currency symbols
-        cleaned = value.strip()
-        cleaned = cleaned.replace(NumberUtils.CURRENCY_SYMBOL, "")
-        cleaned = cleaned.replace(NumberUtils.CURRENCY_SYMBOL_VND, "")
-        cleaned = cleaned.strip()
-        
-        # Handle different formats
-        # Format 1: 1,000,000.50 (US format)
-        # Format 2: 1.000.000,50 (EU format)
-        
-        # Count separators to determine format
-        comma_count = cleaned.count(",")
-        dot_count = cleaned.count(".")
-        
-        if comma_count > 0 and dot_count > 0:
-            # Mixed separators - determine which is decimal
-            last_comma_pos = cleaned.rfind(",")
-            last_dot_pos = cleaned.rfind(".")
-            
-            if last_comma_pos > last_dot_pos:
-                # EU format: 1.000.000,50
-                cleaned = cleaned.replace(".", "").replace(",", ".")
-            else:
-                # US format: 1,000,000.50
-                cleaned = cleaned.replace(",", "")
-        elif comma_count > 1:
-            # Multiple commas - thousand separator
-            cleaned = cleaned.replace(",", "")
-        elif dot_count > 1:
-            # Multiple dots - thousand separator (EU)
-            cleaned = cleaned.replace(".", "")
-        elif comma_count == 1:
-            # Single comma - could be decimal or thousand
-            parts = cleaned.split(",")
-            if len(parts[1]) <= 2:
-                # Likely decimal: 1000,50
-                cleaned = cleaned.replace(",", ".")
-            else:
-                # Likely thousand: 1,000
-                cleaned = cleaned.replace(",", "")
-        
-        try:
-            return float(cleaned)
-        except ValueError:
-            return None
+            NumPy float64 array, NaN where a value is empty or invalid
+        """
+        import numpy as np
+        
+        nan = float("nan")
+        parsed = map(parse_number, values)
+        return np.fromiter(
+            (nan if number is None else number for number in parsed),
+            dtype=np.float64,
+            count=len(values)
+        )
     
     @staticmethod
     def parse_int(value: str) -> Optional[int]:
@@ -192,7 +289,7 @@ class NumberUtils:
         Returns:
             Parsed integer or None if invalid
         """
-        parsed = NumberUtils.parse_number(value)
+        parsed = parse_number(value)
         if parsed is not None:
             return int(parsed)
         return None
@@ -216,27 +313,55 @@ class NumberUtils:
         Returns:
             Tuple of (is_valid, error_message)
         """
+        is_valid, error, _ = NumberUtils.validate_and_parse_number(
+            value, min_value, max_value, allow_negative, allow_decimal
+        )
+        return is_valid, error
+    
+    @staticmethod
+    def validate_and_parse_number(value: str, 
+                                  min_value: Optional[float] = None,
+                                  max_value: Optional[float] = None,
+                                  allow_negative: bool = True,
+                                  allow_decimal: bool = True) -> tuple[bool, str, Optional[float]]:
+        """
+        Validate number string and return the parsed value
+        
+        Same checks as validate_number; callers that need the number after
+        validating should use this instead of calling parse_number again.
+        
+        Args:
+            value: String to validate
+            min_value: Minimum allowed value
+            max_value: Maximum allowed value
+            allow_negative: Whether negative numbers are allowed
+            allow_decimal: Whether decimal numbers are allowed
+            
+        Returns:
+            Tuple of (is_valid, error_message, parsed_value); parsed_value is
+            None when validation fails
+        """
         if not value or not value.strip():
-            return False, "Giá trị không được để trống"
+            return False, "Giá trị không được để trống", None
         
-        parsed = NumberUtils.parse_number(value)
+        parsed = parse_number(value)
         
         if parsed is None:
-            return False, "Giá trị không phải là số hợp lệ"
+            return False, "Giá trị không phải là số hợp lệ", None
         
         if not allow_negative and parsed < 0:
-            return False, "Giá trị không được âm"
+            return False, "Giá trị không được âm", None
         
         if not allow_decimal and parsed != int(parsed):
-            return False, "Giá trị phải là số nguyên"
+            return False, "Giá trị phải là số nguyên", None
         
         if min_value is not None and parsed < min_value:
-            return False, f"Giá trị phải lớn hơn hoặc bằng {NumberUtils.format_number(min_value)}"
+            return False, f"Giá trị phải lớn hơn hoặc bằng {NumberUtils.format_number(min_value)}", None
         
         if max_value is not None and parsed > max_value:
-            return False, f"Giá trị phải nhỏ hơn hoặc bằng {NumberUtils.format_number(max_value)}"
+            return False, f"Giá trị phải nhỏ hơn hoặc bằng {NumberUtils.format_number(max_value)}", None
         
-        return True, ""
+        return True, "", parsed
     
     @staticmethod
     def is_number(value: str) -> bool:
@@ -249,7 +374,10 @@ class NumberUtils:
         Returns:
             True if valid number, False otherwise
         """
-        return NumberUtils.parse_number(value) is not None
+        if isinstance(value, str) and value.isdecimal():
+            # Plain digit strings always parse; skip the float conversion
+            return True
+        return parse_number(value) is not None
     
     @staticmethod
     def round_number(value: Union[int, float, Decimal], 
@@ -275,12 +403,29 @@ class NumberUtils:
         if value is None:
             return 0
         
+        # Exact types only: bool/int subclasses may not str() as digits
+        value_type = type(value)
+        if decimal_places == 0 and rounding_mode == ROUND_HALF_UP:
+            if value_type is int:
+                return value
+            if value_type is float and -_FLOAT_INT_LIMIT < value < _FLOAT_INT_LIMIT:
+                return _round_half_up(value)
+        elif (value_type is int and 0 < decimal_places < 7
+              and -_FLOAT_INT_LIMIT < value < _FLOAT_INT_LIMIT):
+            # Whole numbers have nothing to round; the bounds keep the digit
+            # count inside the Decimal context where quantize() would succeed
+            return float(value)
+        
         try:
-            decimal_value = Decimal(str(value))
+            # Floats still go through str(): their shortest repr is what
+            # ROUND_HALF_UP should see (1.005 -> 1.01, not the binary 1.00499...)
+            decimal_value = value if isinstance(value, Decimal) else Decimal(str(value))
+            quantizer = _QUANTIZERS.get(decimal_places)
+            if quantizer is None:
+                quantizer = Decimal(10) ** -decimal_places
             if decimal_places == 0:
-                return int(decimal_value.quantize(Decimal('1'), rounding=rounding_mode))
+                return int(decimal_value.quantize(quantizer, rounding=rounding_mode))
             else:
-                quantizer = Decimal(10) ** -decimal_places
                 return float(decimal_value.quantize(quantizer, rounding=rounding_mode))
         except (ValueError, InvalidOperation):
             return 0
@@ -306,6 +451,14 @@ class NumberUtils:
         if value is None:
             return 0
         
+        if isinstance(value, int) and isinstance(nearest, int) and nearest > 0:
+            # Exact integer path; ties go to the even multiple like round()
+            quotient, remainder = divmod(value, nearest)
+            twice = remainder * 2
+            if twice > nearest or (twice == nearest and quotient & 1):
+                quotient += 1
+            return quotient * nearest
+        
         try:
             return int(round(float(value) / nearest) * nearest)
         except (ValueError, TypeError):
@@ -335,6 +488,10 @@ class NumberUtils:
         if total == 0:
             return 0.0
         
+        if isinstance(value, (int, float)) and isinstance(total, (int, float)):
+            # Plain numbers divide directly, no float() casts
+            return NumberUtils.round_number((value / total) * 100, decimal_places)
+        
         try:
             percentage = (float(value) / float(total)) * 100
             return NumberUtils.round_number(percentage, decimal_places)
@@ -365,6 +522,51 @@ class NumberUtils:
         except (ValueError, TypeError):
             return 0.0
     
+    @staticmethod
+    def calculate_percentages(values: Any, totals: Any, decimal_places: int = 2) -> Any:
+        """
+        Calculate many percentages at once (batch reports)
+        
+        Rows with a zero total give 0.0 like calculate_percentage. Rounding
+        uses NumPy's round-half-to-even, so exact ties may differ from the
+        scalar ROUND_HALF_UP result in the last decimal place.
+        
+        Args:
+            values: Part values (sequence or NumPy array)
+            totals: Total values, one per row or a single total
+            decimal_places: Number of decimal places
+            
+        Returns:
+            NumPy float64 array of percentages
+        """
+        import numpy as np
+        
+        values = np.asarray(values, dtype=np.float64)
+        totals = np.asarray(totals, dtype=np.float64)
+        ratios = np.divide(
+            values, totals,
+            out=np.zeros(np.broadcast(values, totals).shape),
+            where=totals != 0
+        )
+        return np.round(ratios * 100, decimal_places)
+    
+    @staticmethod
+    def apply_percentages(values: Any, percentages: Any) -> Any:
+        """
+        Apply percentages to many values at once (batch reports)
+        
+        Args:
+            values: Base values (sequence or NumPy array)
+            percentages: Percentages, one per value or a single percentage
+            
+        Returns:
+            NumPy float64 array, same arithmetic as apply_percentage
+        """
+        import numpy as np
+        
+        values = np.asarray(values, dtype=np.float64)
+        return values * (np.asarray(percentages, dtype=np.float64) / 100)
+    
     @staticmethod
     def clamp(value: Union[int, float], 
              min_value: Union[int, float], 
@@ -380,7 +582,29 @@ class NumberUtils:
         Returns:
             Clamped value
         """
-        return max(min_value, min(value, max_value))
+        # Same comparisons as max(min_value, min(value, max_value)) without
+        # the two builtin calls
+        upper = max_value if max_value < value else value
+        return upper if upper > min_value else min_value
+    
+    @staticmethod
+    def clamp_array(values: Any,
+                    min_value: Union[int, float],
+                    max_value: Union[int, float]) -> Any:
+        """
+        Clamp many values between min and max at once
+        
+        Args:
+            values: Sequence or NumPy array of values
+            min_value: Minimum value (must not exceed max_value)
+            max_value: Maximum value
+            
+        Returns:
+            NumPy array of clamped values
+        """
+        import numpy as np
+        
+        return np.clip(np.asarray(values), min_value, max_value)
     
     @staticmethod
     def safe_divide(numerator: Union[int, float], 
@@ -397,6 +621,10 @@ class NumberUtils:
         Returns:
             Division result or default
         """
+        if isinstance(numerator, (int, float)) and isinstance(denominator, (int, float)):
+            # Plain numbers divide directly, no float() casts
+            return default if denominator == 0 else numerator / denominator
+        
         try:
             if denominator == 0:
                 return default
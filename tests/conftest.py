@@ -6,6 +6,16 @@ import pytest
 from PyQt6.QtWidgets import QApplication
 
 
+@pytest.fixture(scope="session", autouse=True)
+def isolated_log_file(tmp_path_factory):
+    """Write log files to a temporary directory instead of the repository"""
+    import config
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(config, "LOG_FILE", tmp_path_factory.mktemp("logs") / "transportapp.log")
+        yield
+
+
 @pytest.fixture(scope="session")
 def qapp():
     """Create QApplication instance for tests"""
@@ -8,6 +8,7 @@ import sqlite3
 import tempfile
 import os
 from datetime import datetime
+from unittest.mock import patch
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
 
@@ -265,7 +266,129 @@ class TestFormToDatabaseIntegration:
         # Verify ma_chuyen sequence
         for i, trip in enumerate(trips, 1):
             assert trip.ma_chuyen == f'C{i:03d}'
-    
+
+    def test_bulk_create_generates_sequential_codes(self, trip_service):
+        """Test bulk creation continues the trip code sequence"""
+        trip_service.create_trip({'khach_hang': 'Existing', 'gia_ca': 1000000})
+
+        trips = trip_service.bulk_create_trips([
+            {'khach_hang': f'Bulk {i}', 'gia_ca': 1000000}
+            for i in range(3)
+        ])
+
+        assert [t.ma_chuyen for t in trips] == ['C002', 'C003', 'C004']
+
+    def test_bulk_create_reads_code_sequence_once(self, trip_service, db_manager):
+        """Test bulk creation looks up the trip code sequence once per call"""
+        with patch.object(
+            db_manager, 'get_current_max_trip_code_number',
+            wraps=db_manager.get_current_max_trip_code_number
+        ) as max_lookup:
+            trips = trip_service.bulk_create_trips([
+                {'khach_hang': f'Bulk {i}', 'gia_ca': 1000000}
+                for i in range(5)
+            ])
+
+        assert max_lookup.call_count == 1
+        assert [t.ma_chuyen for t in trips] == [f'C{i:03d}' for i in range(1, 6)]
+
+    def test_bulk_create_rolls_back_on_invalid_trip(self, trip_service, db_manager):
+        """Test one invalid trip leaves none of the batch in the database"""
+        with pytest.raises(ValueError):
+            trip_service.bulk_create_trips([
+                {'khach_hang': 'Valid', 'gia_ca': 1000000},
+                {'khach_hang': 'Invalid', 'gia_ca': -1}
+            ])
+
+        assert trip_service.get_total_count() == 0
+
+    def test_trip_code_lookup_uses_index(self, db_manager):
+        """Test the trip code sequence is read with an index seek, not a table scan"""
+        from src.database.enhanced_db_manager import _SQL_MAX_TRIP_CODE_NUMBER
+
+        with db_manager.get_connection() as conn:
+            plan = conn.execute("EXPLAIN QUERY PLAN " + _SQL_MAX_TRIP_CODE_NUMBER).fetchall()
+
+        assert any(row['detail'].startswith('SEARCH trips USING INDEX idx_trips_code_number') for row in plan)
+
+    def test_trip_code_sequence_follows_external_insert(self, trip_service, temp_db):
+        """Test generated codes skip a code another writer already took"""
+        trip_service.create_trip({'khach_hang': 'Customer 1', 'gia_ca': 1000000})
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute("INSERT INTO trips (ma_chuyen, khach_hang, gia_ca) VALUES ('C002', 'Other', 1)")
+        conn.commit()
+        conn.close()
+
+        trip = trip_service.create_trip({'khach_hang': 'Customer 2', 'gia_ca': 1000000})
+        assert trip.ma_chuyen == 'C003'
+
+    def test_trip_codes_alternating_services(self, trip_service, db_manager, caplog):
+        """Test two services sharing a database never collide on generated codes"""
+        other_service = TripService(db_manager)
+
+        with caplog.at_level('ERROR'):
+            codes = [
+                service.create_trip({'khach_hang': 'Customer', 'gia_ca': 1000000}).ma_chuyen
+                for service in (trip_service, other_service) * 2
+            ]
+
+        assert codes == ['C001', 'C002', 'C003', 'C004']
+        assert not [r for r in caplog.records if r.levelname == 'ERROR']
+
+    def test_get_trip_by_id_sees_external_writes(self, trip_service, db_manager):
+        """Test trips written through the shared db_manager are read back fresh"""
+        trip = trip_service.create_trip({'khach_hang': 'Customer', 'gia_ca': 1000000})
+        stored = trip_service.get_trip_by_id(trip.id)
+        assert stored.khach_hang == 'Customer'
+        assert isinstance(stored.created_at, datetime)
+
+        db_manager.update_trip(trip.id, {'khach_hang': 'External', 'gia_ca': 1000000})
+        assert trip_service.get_trip_by_id(trip.id).khach_hang == 'External'
+
+        trip_service.update_trip(trip.id, {'gia_ca': 2000000})
+        updated = trip_service.get_trip_by_id(trip.id)
+        assert updated.khach_hang == 'External'
+        assert updated.gia_ca == 2000000
+
+        trip_service.update_trip(trip.id, {'khach_hang': 'Renamed'})
+        assert trip_service.get_trip_by_id(trip.id).khach_hang == 'Renamed'
+
+        trip_service.delete_trip(trip.id)
+        assert trip_service.get_trip_by_id(trip.id) is None
+
+    def test_autocomplete_lists_refresh_after_write(self, trip_service):
+        """Test cached autocomplete lists are invalidated by new trips"""
+        trip_service.create_trip({'khach_hang': 'Customer A', 'diem_di': 'Hanoi', 'gia_ca': 1000000})
+        assert trip_service.get_unique_customers() == ['Customer A']
+
+        trip_service.create_trip({'khach_hang': 'Customer B', 'diem_di': 'Hue', 'gia_ca': 1000000})
+
+        assert trip_service.get_unique_customers() == ['Customer A', 'Customer B']
+        assert trip_service.get_unique_locations('diem_di') == {'diem_di': ['Hanoi', 'Hue']}
+
+    def test_unique_locations_both_in_one_query(self, trip_service):
+        """Test 'both' location lists match the single-column lookups"""
+        trip_service.create_trip({'khach_hang': 'A', 'diem_di': 'Hue', 'diem_den': 'Hanoi', 'gia_ca': 1})
+        trip_service.create_trip({'khach_hang': 'B', 'diem_di': 'Hanoi', 'diem_den': 'Hanoi', 'gia_ca': 1})
+        trip_service.create_trip({'khach_hang': 'C', 'diem_di': 'Hue', 'gia_ca': 1})
+
+        both = trip_service.get_unique_locations()
+
+        assert both == {'diem_di': ['Hanoi', 'Hue'], 'diem_den': ['Hanoi']}
+        assert trip_service.get_unique_locations('diem_den') == {'diem_den': ['Hanoi']}
+
+    def test_iter_trips_streams_in_batches(self, trip_service):
+        """Test iter_trips yields every matching trip across batch boundaries"""
+        for i in range(5):
+            trip_service.create_trip({'khach_hang': f'Customer {i % 2}', 'gia_ca': 1000000})
+
+        all_codes = [t.ma_chuyen for t in trip_service.iter_trips(batch_size=2)]
+        assert all_codes == ['C001', 'C002', 'C003', 'C004', 'C005']
+
+        filtered = list(trip_service.iter_trips({'khach_hang': 'Customer 1'}, batch_size=1))
+        assert [t.ma_chuyen for t in filtered] == ['C002', 'C004']
+
     def test_form_reset_after_submission(self, trip_service):
         """Test that form data is properly handled after submission"""
         # Create trip
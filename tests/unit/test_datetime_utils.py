@@ -78,6 +78,31 @@ class TestDateTimeParsing:
             assert result.month == expected.month
             assert result.day == expected.day
     
+    def test_parse_date_fallback_datetime_shapes(self):
+        """Test datetime strings fall back to the format matching their shape"""
+        expected = datetime(2024, 12, 2, 14, 30, 0)
+        
+        assert DateTimeUtils.parse_date("2024-12-02 14:30:00") == expected
+        assert DateTimeUtils.parse_date("2024-12-02T14:30:00") == expected
+        assert DateTimeUtils.parse_date("2024-1-2") == datetime(2024, 1, 2)
+    
+    def test_parse_dates_batch(self):
+        """Test bulk parsing returns NaT for empty or invalid strings"""
+        result = DateTimeUtils.parse_dates_batch(["02/12/2024", "", "invalid", "31/01/2025"])
+        
+        assert str(result[0])[:10] == "2024-12-02"
+        assert str(result[3])[:10] == "2025-01-31"
+        assert str(result[1]) == "NaT"
+        assert str(result[2]) == "NaT"
+    
+    def test_format_dates_batch_roundtrip(self):
+        """Test bulk formatting matches format_date and blanks missing values"""
+        dates = [datetime(2024, 12, 2), None]
+        
+        assert DateTimeUtils.format_dates_batch(dates) == ["02/12/2024", ""]
+        parsed = DateTimeUtils.parse_dates_batch(["02/12/2024"])
+        assert DateTimeUtils.format_dates_batch(parsed) == ["02/12/2024"]
+    
     def test_parse_date_empty_string(self):
         """Test parsing empty string returns None"""
         result = DateTimeUtils.parse_date("")
@@ -88,6 +113,15 @@ class TestDateTimeParsing:
         result = DateTimeUtils.parse_date("invalid-date")
         assert result is None
     
+    def test_parse_date_strict(self):
+        """Test strict parsing returns the date or raises ValueError"""
+        assert DateTimeUtils.parse_date_strict("02/12/2024") == datetime(2024, 12, 2)
+        
+        with pytest.raises(ValueError, match="Ngày không hợp lệ"):
+            DateTimeUtils.parse_date_strict("12/2024")
+        with pytest.raises(ValueError):
+            DateTimeUtils.parse_date_strict("")
+    
     def test_parse_date_with_time(self):
         """Test parsing datetime string"""
         result = DateTimeUtils.parse_date("2024-12-02 14:30:00", DateTimeUtils.FORMAT_DATETIME)
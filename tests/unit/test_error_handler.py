@@ -404,6 +404,16 @@ class TestErrorRecovery:
         assert mock_func.call_count == 3
         assert "All 3 retry attempts failed" in caplog.text
     
+    def test_retry_on_error_max_delay(self):
+        """Test backoff delay is capped by max_delay"""
+        mock_func = Mock(side_effect=ValueError("Persistent error"))
+        
+        with patch('src.utils.error_handler.time.sleep') as mock_sleep:
+            with pytest.raises(ValueError):
+                ErrorRecovery.retry_on_error(mock_func, max_retries=4, delay=1.0, max_delay=3.0)
+        
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [1.0, 2.0, 3.0]
+    
     def test_with_fallback_primary_success(self):
         """Test fallback with primary function succeeding"""
         primary = Mock(return_value="primary result")
@@ -480,6 +490,27 @@ class TestUtilityFunctions:
         assert 'traceback' in details
         assert details['args'] == ('Test error message',)
     
+    def test_get_error_details_include_tb(self):
+        """Test traceback is only formatted on request for raised errors"""
+        try:
+            raise ValueError("Raised error")
+        except ValueError as e:
+            error = e
+        
+        assert get_error_details(error)['traceback'] is None
+        tb_text = get_error_details(error, include_tb=True)['traceback']
+        assert 'ValueError: Raised error' in tb_text
+        assert get_error_details(ValueError("never raised"), include_tb=True)['traceback'] is None
+    
+    def test_format_error_for_user_subclass(self):
+        """Test subclasses of custom exceptions inherit the friendly message"""
+        class LockedDatabaseError(DatabaseError):
+            pass
+        
+        message = format_error_for_user(LockedDatabaseError("database is locked"))
+        
+        assert message == "Lỗi cơ sở dữ liệu: database is locked"
+    
     def test_format_error_for_user_validation(self):
         """Test formatting ValidationError for user"""
         error = ValidationError("Invalid data")
@@ -7,7 +7,10 @@ Tests for Task 15: Implement Error Handling và Logging
 import pytest
 import logging
 from pathlib import Path
-from src.utils.logger import setup_logging, get_logger, get_performance_logger, log_context
+from src.utils.logger import (
+    setup_logging, shutdown_logging, get_logger, get_performance_logger, log_context, FastFormatter,
+    log_function_call, BufferedFileHandler
+)
 from src.utils.error_handler import (
     ErrorHandler,
     ValidationError,
@@ -38,6 +41,78 @@ class TestLoggingSystem:
         assert logger.name == "TransportApp"
         assert len(logger.handlers) > 0
     
+    def test_setup_logging_queues_records(self):
+        """Test the logger only enqueues records and can be restarted"""
+        from logging.handlers import QueueHandler
+        
+        logger = setup_logging()
+        assert all(isinstance(h, QueueHandler) for h in logger.handlers)
+        
+        shutdown_logging()
+        assert logger.handlers == []
+        
+        logger = setup_logging()
+        assert len(logger.handlers) == 1
+    
+    def test_structured_logging_keeps_exception_field(self, tmp_path, monkeypatch):
+        """Test tracebacks reach the JSON 'exception' field through the log queue"""
+        import json
+        import config
+        
+        monkeypatch.setattr(config, "LOG_FILE", tmp_path / "structured.log")
+        shutdown_logging()
+        logger = setup_logging(enable_structured=True)
+        try:
+            try:
+                1 / 0
+            except ZeroDivisionError:
+                logger.exception("Division failed for %s", "trip")
+        finally:
+            shutdown_logging()
+        
+        entries = [json.loads(line) for line in (tmp_path / "structured.log").read_text(encoding="utf-8").splitlines()]
+        entry = next(e for e in entries if e['message'] == "Division failed for trip")
+        assert "ZeroDivisionError" in entry['exception']
+    
+    def test_buffered_file_handler_flushes_without_new_records(self):
+        """Test buffered records are written once the interval elapses with no further logging"""
+        import time
+        
+        class ListHandler(logging.Handler):
+            def __init__(self):
+                super().__init__()
+                self.records = []
+            
+            def emit(self, record):
+                self.records.append(record)
+        
+        target = ListHandler()
+        handler = BufferedFileHandler(target, capacity=100, flush_interval=0.05)
+        try:
+            handler.handle(logging.LogRecord("test", logging.INFO, __file__, 1, "quiet", None, None))
+            assert target.records == []
+            
+            deadline = time.monotonic() + 2.0
+            while not target.records and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert [r.getMessage() for r in target.records] == ["quiet"]
+        finally:
+            handler.close()
+        assert not handler._flusher.is_alive()
+    
+    def test_fast_formatter_matches_standard_formatter(self):
+        """Test cached timestamps format like logging.Formatter"""
+        import logging
+        
+        fmt = "%(asctime)s - %(levelname)s - %(message)s"
+        fast, standard = FastFormatter(fmt), logging.Formatter(fmt)
+        
+        for offset in (0.0, 0.4, 1.2):
+            record = logging.LogRecord("test", logging.INFO, __file__, 1, "message", None, None)
+            record.created -= offset
+            record.msecs = (record.created - int(record.created)) * 1000
+            assert fast.format(record) == standard.format(record)
+    
     def test_get_logger(self):
         """Test getting logger instance"""
         logger = get_logger("test_module")
@@ -53,6 +128,32 @@ class TestLoggingSystem:
         """Test log context manager"""
         with log_context("Test operation"):
             pass  # Should log start and completion
+    
+    def test_log_function_call_exc_info_config(self, monkeypatch):
+        """Test LOG_EXC_INFO controls tracebacks on decorator error logs"""
+        import config
+        
+        records = []
+        logger = logging.getLogger("test_exc_info")
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        handler = logging.Handler()
+        handler.emit = records.append
+        logger.addHandler(handler)
+        
+        @log_function_call(logger)
+        def failing():
+            raise ValueError("boom")
+        
+        try:
+            for enabled in (True, False):
+                monkeypatch.setattr(config, "LOG_EXC_INFO", enabled)
+                with pytest.raises(ValueError):
+                    failing()
+                error = [r for r in records if r.levelno == logging.ERROR][-1]
+                assert bool(error.exc_info) is enabled
+        finally:
+            logger.removeHandler(handler)
 
 
 class TestErrorHandlers:
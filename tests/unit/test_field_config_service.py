@@ -15,9 +15,9 @@ from src.models.field_configuration import FieldType, WidgetType
 
 
 @pytest.fixture
-def db_manager():
+def db_manager(tmp_path):
     """Create a test database manager"""
-    db = EnhancedDatabaseManager("data/test_transport.db")
+    db = EnhancedDatabaseManager(str(tmp_path / "test_transport.db"))
     yield db
     db.close()
 
@@ -2,6 +2,7 @@
 Unit tests for Pydantic models
 """
 import pytest
+import json
 from datetime import datetime
 from pydantic import ValidationError
 
@@ -65,6 +66,16 @@ class TestTripModel:
             )
         
         assert "greater than or equal to 0" in str(exc_info.value)
+    
+    def test_to_insert_tuple(self):
+        """Test insert tuple follows model_fields_for_insert order"""
+        trip = Trip(ma_chuyen="C001", khach_hang="Công ty ABC", diem_di="Hà Nội", gia_ca=5000000)
+        
+        values = trip.to_insert_tuple()
+        
+        assert len(values) == len(Trip.model_fields_for_insert)
+        assert values == tuple(getattr(trip, name) for name in Trip.model_fields_for_insert)
+        assert values[:3] == ("C001", "Công ty ABC", "Hà Nội")
 
 
 class TestCompanyPriceModel:
@@ -347,3 +358,47 @@ class TestEmployeeWorkspaceModel:
         
         workspace.set_config_value("theme", "light")
         assert workspace.get_config_value("theme") == "light"
+    
+    def test_serialized_configuration_tracks_changes(self):
+        """Test cached configuration JSON is refreshed after every kind of change"""
+        workspace = EmployeeWorkspace(
+            employee_id=1,
+            workspace_name="Project A",
+            configuration={"theme": "dark"}
+        )
+        assert json.loads(workspace.serialized_configuration()) == {"theme": "dark"}
+        
+        workspace.set_config_value("layout", "grid")
+        assert json.loads(workspace.serialized_configuration()) == {"theme": "dark", "layout": "grid"}
+        
+        workspace.configuration = {"theme": "light"}
+        assert json.loads(workspace.serialized_configuration()) == {"theme": "light"}
+        
+        copied = workspace.model_copy(update={"configuration": {"a": 1}})
+        assert json.loads(copied.serialized_configuration()) == {"a": 1}
+        
+        copied.configuration["b"] = 2
+        assert json.loads(copied.serialized_configuration()) == {"a": 1, "b": 2}
+    
+    def test_serialized_configuration_rejects_unserializable_values(self):
+        """Test non-JSON configuration values are reported when serialized"""
+        workspace = EmployeeWorkspace(
+            employee_id=1,
+            workspace_name="Project A",
+            configuration={"callback": object()}
+        )
+        
+        with pytest.raises(ValueError, match="serialize thành JSON"):
+            workspace.serialized_configuration()
+    
+    def test_serialized_configuration_matches_service_encoder(self):
+        """Test configuration JSON uses the same encoder as workspace writes"""
+        from src.services.workspace_service import _dumps_json
+        
+        configuration = {"theme": "tối", "columns": [1, 2.5, None]}
+        workspace = EmployeeWorkspace(
+            employee_id=1,
+            workspace_name="Project A",
+            configuration=configuration
+        )
+        assert workspace.serialized_configuration() == _dumps_json(configuration)
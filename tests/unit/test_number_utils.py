@@ -55,6 +55,12 @@ class TestCurrencyFormatting:
         """Test formatting Decimal type"""
         result = NumberUtils.format_currency(Decimal("1234567.89"))
         assert "1,234,567.89" in result
+    
+    def test_format_currency_large_int_exact(self):
+        """Test integers beyond float precision are formatted exactly"""
+        value = 2 ** 53 + 1
+        assert NumberUtils.format_currency(value, include_symbol=False) == f"{value:,}"
+        assert NumberUtils.format_number(value) == f"{value:,}"
 
 
 class TestNumberFormatting:
@@ -150,6 +156,14 @@ class TestNumberParsing:
         result = NumberUtils.parse_number("  1,234.56  ")
         assert result == 1234.56
     
+    def test_parse_numbers_batch(self):
+        """Test bulk parsing matches parse_number and uses NaN for invalid"""
+        result = NumberUtils.parse_numbers_batch(["1,000,000", "", "abc", "1.234,56", None])
+        
+        assert result[0] == 1000000.0
+        assert result[3] == 1234.56
+        assert all(value != value for value in (result[1], result[2], result[4]))
+    
     def test_parse_int_simple(self):
         """Test parsing integer"""
         result = NumberUtils.parse_int("1234")
@@ -181,6 +195,15 @@ class TestNumberValidation:
         assert is_valid is True
         assert error == ""
     
+    def test_validate_and_parse_number(self):
+        """Test validation returns the parsed value only on success"""
+        assert NumberUtils.validate_and_parse_number("1,000") == (True, "", 1000.0)
+        
+        is_valid, error, parsed = NumberUtils.validate_and_parse_number("-5", allow_negative=False)
+        assert not is_valid
+        assert error
+        assert parsed is None
+    
     def test_validate_number_empty(self):
         """Test validating empty string"""
         is_valid, error = NumberUtils.validate_number("")
@@ -264,6 +287,13 @@ class TestRounding:
         result = NumberUtils.round_number(1234.5, decimal_places=0)
         assert result == 1235
     
+    def test_round_number_float_ties_away_from_zero(self):
+        """Test integer rounding of floats matches Decimal ROUND_HALF_UP"""
+        assert NumberUtils.round_number(2.5) == 3
+        assert NumberUtils.round_number(-2.5) == -3
+        assert NumberUtils.round_number(0.49999999999999994) == 0
+        assert NumberUtils.round_number(float("nan")) == 0
+    
     def test_round_number_none(self):
         """Test rounding None returns 0"""
         result = NumberUtils.round_number(None)
@@ -289,6 +319,19 @@ class TestRounding:
         result = NumberUtils.round_to_nearest(1234, nearest=100)
         assert result == 1200
     
+    def test_round_to_nearest_int_matches_float(self):
+        """Test integer rounding agrees with the float path, ties to even"""
+        for value in (1500, 2500, -1500, -2500, 1499, -1501, 0, 999999):
+            assert NumberUtils.round_to_nearest(value, 1000) == \
+                NumberUtils.round_to_nearest(float(value), 1000)
+    
+    def test_round_to_nearest_large_int_exact(self):
+        """Test rounding integers beyond float precision stays exact"""
+        value = 2 ** 60 + 1234567
+        result = NumberUtils.round_to_nearest(value, nearest=1000)
+        assert result % 1000 == 0
+        assert abs(result - value) <= 500
+    
     def test_round_to_nearest_none(self):
         """Test rounding None returns 0"""
         result = NumberUtils.round_to_nearest(None, nearest=1000)
@@ -342,6 +385,16 @@ class TestPercentageCalculations:
         """Test applying percentage over 100"""
         result = NumberUtils.apply_percentage(1000, 150)
         assert result == 1500.0
+    
+    def test_calculate_percentages_batch(self):
+        """Test batch percentages match the scalar version, zero totals give 0"""
+        result = NumberUtils.calculate_percentages([25, 1, 5], [100, 3, 0])
+        assert list(result) == [25.0, 33.33, 0.0]
+    
+    def test_apply_percentages_batch(self):
+        """Test batch percentage application with a shared percentage"""
+        result = NumberUtils.apply_percentages([1000, 2000], 10)
+        assert list(result) == [NumberUtils.apply_percentage(v, 10) for v in (1000, 2000)]
 
 
 class TestUtilityFunctions:
@@ -396,6 +449,12 @@ class TestUtilityFunctions:
         """Test safe division with float result"""
         result = NumberUtils.safe_divide(100, 3)
         assert abs(result - 33.333333) < 0.00001
+    
+    def test_clamp_array(self):
+        """Test array clamping matches scalar clamp"""
+        values = [-10, 0, 50, 100, 150]
+        result = NumberUtils.clamp_array(values, 0, 100)
+        assert list(result) == [NumberUtils.clamp(v, 0, 100) for v in values]
 
 
 class TestEdgeCases:
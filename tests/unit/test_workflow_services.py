@@ -5,6 +5,7 @@ Tests PushConditionsService and WorkflowService
 import pytest
 import json
 from datetime import datetime
+from unittest.mock import patch
 from src.services.push_conditions_service import PushConditionsService
 from src.services.workflow_service import WorkflowService
 from src.models.push_condition import PushCondition, ConditionOperator, LogicOperator
@@ -375,8 +376,10 @@ class TestPushConditionsService:
             
             record_data = {'test_field': field_value}
             result = push_conditions_service.evaluate_conditions([condition], record_data)
+            compiled_result = push_conditions_service.compile_conditions([condition])(record_data)
             
             assert result == expected, f"Failed for operator {operator} with field_value={field_value}, condition_value={condition_value}"
+            assert compiled_result == expected, f"Compiled condition failed for operator {operator} with field_value={field_value}, condition_value={condition_value}"
     
     def test_validate_condition(self, push_conditions_service):
         """Test condition validation"""
@@ -461,6 +464,47 @@ class TestWorkflowService:
         
         assert result is True
     
+    def test_bulk_push_records(self, workflow_service, db_manager):
+        """Test pushing several records in one batch"""
+        records = [
+            (1, {'khach_hang': 'Customer A'}, 1, 2),
+            (2, {'khach_hang': 'Customer B'}, 1, 3)
+        ]
+        
+        pushed = workflow_service.bulk_push_records(
+            records,
+            pushed_by=1,
+            field_mapping={'khach_hang': 'customer_name'}
+        )
+        
+        assert pushed == 2
+        
+        target_records = db_manager.get_business_records(3)
+        assert len(target_records) == 1
+        assert json.loads(target_records[0]['record_data']) == {'customer_name': 'Customer B'}
+        
+        history = workflow_service.get_workflow_history(source_department_id=1)
+        assert len(history) == 2
+        assert all(h.status == WorkflowStatus.SUCCESS for h in history)
+    
+    def test_bulk_push_records_falls_back_to_single_pushes(self, workflow_service, db_manager):
+        """Test a failed batch still pushes each record on its own"""
+        records = [
+            (1, {'khach_hang': 'Customer A'}, 1, 2),
+            (2, {'khach_hang': 'Customer B'}, 1, 3)
+        ]
+        
+        with patch.object(db_manager, 'insert_pushed_records', side_effect=Exception("database is locked")):
+            pushed = workflow_service.bulk_push_records(records, pushed_by=1)
+        
+        assert pushed == 2
+        assert len(db_manager.get_business_records(2)) == 1
+        assert len(db_manager.get_business_records(3)) == 1
+        
+        history = workflow_service.get_workflow_history(source_department_id=1)
+        assert len(history) == 2
+        assert all(h.status == WorkflowStatus.SUCCESS for h in history)
+    
     def test_auto_push_if_conditions_met(self, workflow_service, push_conditions_service):
         """Test automatic push when conditions are met"""
         # Create push condition
@@ -505,6 +549,47 @@ class TestWorkflowService:
         
         assert result_fail is False
     
+    def test_auto_push_sees_updated_conditions(self, workflow_service, push_conditions_service):
+        """Test cached compiled conditions are refreshed after a condition changes"""
+        condition_id = push_conditions_service.create_push_condition(PushCondition(
+            source_department_id=1,
+            target_department_id=2,
+            field_name='status',
+            operator=ConditionOperator.EQUALS,
+            value='completed',
+            logic_operator=LogicOperator.AND
+        ))
+        
+        assert workflow_service.check_push_conditions(1, {'status': 'completed'}, 1, 2) is True
+        
+        push_conditions_service.update_push_condition(condition_id, {'value': 'approved'})
+        
+        assert workflow_service.check_push_conditions(1, {'status': 'completed'}, 1, 2) is False
+        assert workflow_service.check_push_conditions(1, {'status': 'approved'}, 1, 2) is True
+    
+    def test_no_conditions_short_circuit(self, workflow_service, push_conditions_service):
+        """Test pairs without conditions are not looked up again until conditions change"""
+        with patch.object(
+            workflow_service.push_conditions_service,
+            'get_push_conditions',
+            wraps=workflow_service.push_conditions_service.get_push_conditions
+        ) as get_conditions:
+            assert workflow_service.check_push_conditions(1, {'status': 'completed'}, 1, 2) is False
+            assert workflow_service.check_push_conditions(2, {'status': 'completed'}, 1, 2) is False
+            assert get_conditions.call_count == 1
+            
+            push_conditions_service.create_push_condition(PushCondition(
+                source_department_id=1,
+                target_department_id=2,
+                field_name='status',
+                operator=ConditionOperator.EQUALS,
+                value='completed',
+                logic_operator=LogicOperator.AND
+            ))
+            
+            assert workflow_service.check_push_conditions(3, {'status': 'completed'}, 1, 2) is True
+            assert get_conditions.call_count == 2
+    
     def test_transform_data(self, workflow_service):
         """Test data transformation"""
         source_data = {
@@ -547,6 +632,7 @@ class TestWorkflowService:
         history = workflow_service.get_workflow_history(record_id=1)
         assert len(history) == 1
         assert history[0].status == WorkflowStatus.SUCCESS
+        assert isinstance(history[0].created_at, datetime)
     
     def test_get_workflow_history_with_filters(self, workflow_service):
         """Test retrieving workflow history with filters"""
@@ -79,6 +79,13 @@ class TestWorkspaceCRUD:
         
         assert workspace.configuration == config
     
+    def test_create_workspace_unserializable_configuration(self, workspace_service):
+        """Test a configuration that cannot be stored as JSON is rejected before the insert"""
+        with pytest.raises(ValueError, match="serialize thành JSON"):
+            workspace_service.create_workspace(1, "Broken", {'callback': object()})
+        
+        assert workspace_service.get_workspace_by_name(1, "Broken") is None
+    
     def test_create_workspace_duplicate_name(self, workspace_service):
         """Test creating workspace with duplicate name fails"""
         workspace_service.create_workspace(
@@ -153,6 +160,32 @@ class TestWorkspaceCRUD:
         assert "Workspace 2" in names
         assert "Workspace 3" in names
     
+    def test_cached_workspaces_are_copies(self, workspace_service):
+        """Test unsaved changes to returned workspaces never reach the cache"""
+        workspace = workspace_service.create_workspace(1, "Copy WS", {'k': 1})
+        
+        workspace_service.get_workspace_by_id(workspace.id).set_config_value('k', 999)
+        workspace_service.get_workspace_by_name(1, "Copy WS").set_config_value('k', 999)
+        workspace_service.get_workspaces_for_employee(1, include_configuration=True)[0].workspace_name = "X"
+        
+        assert workspace_service.get_workspace_by_id(workspace.id).get_config_value('k') == 1
+        assert workspace_service.get_workspace_by_name(1, "Copy WS").get_config_value('k') == 1
+        names = [ws.workspace_name for ws in workspace_service.get_workspaces_for_employee(1, include_configuration=True)]
+        assert names == ["Copy WS"]
+    
+    def test_get_workspaces_include_configuration(self, workspace_service):
+        """Test configuration is only loaded for workspace lists when requested"""
+        workspace_service.create_workspace(1, "Configured", {'theme': 'dark'})
+        
+        light = workspace_service.get_workspaces_for_employee(1)
+        full = workspace_service.get_workspaces_for_employee(1, include_configuration=True)
+        
+        assert light[0].workspace_name == "Configured"
+        assert light[0].configuration is None
+        assert full[0].configuration == {'theme': 'dark'}
+        assert full[0].model_dump()['configuration'] == {'theme': 'dark'}
+        assert full[0].get_config_value('theme') == 'dark'
+    
     def test_get_workspaces_active_only(self, workspace_service):
         """Test retrieving only active workspaces"""
         ws1 = workspace_service.create_workspace(1, "Active")
@@ -206,6 +239,21 @@ class TestWorkspaceCRUD:
         
         assert updated.is_active is False
     
+    def test_update_workspace_keeps_unchanged_columns(self, workspace_service, db_manager):
+        """Test a partial update leaves the other columns untouched in the database"""
+        workspace = workspace_service.create_workspace(1, "Partial", {'theme': 'dark'})
+        
+        workspace_service.update_workspace(workspace.id, is_active=False)
+        
+        row = db_manager.execute_query(
+            "SELECT workspace_name, configuration, is_active FROM employee_workspaces WHERE id = ?",
+            (workspace.id,),
+            use_cache=False
+        )[0]
+        assert row['workspace_name'] == "Partial"
+        assert json.loads(row['configuration']) == {'theme': 'dark'}
+        assert row['is_active'] == 0
+    
     def test_update_workspace_not_found(self, workspace_service):
         """Test updating non-existent workspace"""
         with pytest.raises(ValueError, match="không tồn tại"):
@@ -219,6 +267,22 @@ class TestWorkspaceCRUD:
         with pytest.raises(ValueError, match="đã tồn tại"):
             workspace_service.update_workspace(ws2.id, workspace_name="Workspace A")
     
+    def test_workspace_lookup_cache_invalidated_on_update(self, workspace_service, db_manager):
+        """Test cached lookups are served without a query and refreshed after updates"""
+        workspace = workspace_service.create_workspace(1, "Cached")
+        workspace_service.get_workspace_by_id(workspace.id)
+        
+        original_execute_query = db_manager.execute_query
+        db_manager.execute_query = lambda *args, **kwargs: pytest.fail("cached workspace re-read")
+        assert workspace_service.get_workspace_by_id(workspace.id).workspace_name == "Cached"
+        db_manager.execute_query = original_execute_query
+        
+        workspace_service.update_workspace(workspace.id, workspace_name="Renamed")
+        
+        assert workspace_service.get_workspace_by_id(workspace.id).workspace_name == "Renamed"
+        assert workspace_service.get_workspace_by_name(1, "Cached") is None
+        assert [ws.workspace_name for ws in workspace_service.get_workspaces_for_employee(1)] == ["Renamed"]
+    
     def test_delete_workspace(self, workspace_service):
         """Test deleting a workspace"""
         workspace = workspace_service.create_workspace(1, "To Delete")
@@ -266,6 +330,26 @@ class TestWorkspaceSwitching:
         assert active is not None
         assert active.id == ws1.id
     
+    def test_active_workspace_follows_updates(self, workspace_service):
+        """Test the stored active workspace reflects renames and is dropped on delete"""
+        ws = workspace_service.create_workspace(1, "Before")
+        workspace_service.switch_workspace(1, ws.id)
+        
+        workspace_service.update_workspace(ws.id, workspace_name="After")
+        assert workspace_service.get_active_workspace(1).workspace_name == "After"
+        
+        workspace_service.delete_workspace(ws.id)
+        assert workspace_service.get_active_workspace(1) is None
+    
+    def test_active_workspace_is_a_copy(self, workspace_service):
+        """Test callers cannot change the stored active workspace"""
+        ws = workspace_service.create_workspace(1, "Active Copy", {'k': 1})
+        
+        workspace_service.switch_workspace(1, ws.id).set_config_value('k', 2)
+        workspace_service.get_active_workspace(1).set_config_value('k', 3)
+        
+        assert workspace_service.get_active_workspace(1).get_config_value('k') == 1
+    
     def test_switch_workspace_not_found(self, workspace_service):
         """Test switching to non-existent workspace"""
         with pytest.raises(ValueError, match="không tồn tại"):
@@ -294,6 +378,18 @@ class TestWorkspaceSwitching:
         with pytest.raises(ValueError, match="không hoạt động"):
             workspace_service.switch_workspace(1, ws.id)
     
+    def test_create_records_in_inactive_workspace(self, workspace_service):
+        """Test records cannot be written into an inactive workspace"""
+        ws = workspace_service.create_workspace(1, "Closed WS")
+        workspace_service.update_workspace(ws.id, is_active=False)
+        
+        with pytest.raises(ValueError, match="không hoạt động"):
+            workspace_service.create_workspace_record(ws.id, 1, 1, {'a': 1})
+        with pytest.raises(ValueError, match="không hoạt động"):
+            workspace_service.create_workspace_records_bulk(ws.id, 1, 1, [{'a': 1}])
+        
+        assert workspace_service.get_workspace_record_stats(ws.id)['total'] == 0
+    
     def test_switch_between_workspaces(self, workspace_service):
         """Test switching between multiple workspaces"""
         ws1 = workspace_service.create_workspace(1, "WS 1")
@@ -359,6 +455,16 @@ class TestConfigurationExportImport:
         assert workspace.configuration == {'key': 'value'}
         assert workspace.is_active is True
     
+    def test_import_inactive_workspace(self, workspace_service):
+        """Test importing an inactive workspace stores it inactive directly"""
+        import_data = {'workspace_name': 'Archived WS', 'is_active': False}
+        
+        workspace = workspace_service.import_workspace_configuration(1, import_data)
+        
+        assert workspace.is_active is False
+        assert workspace_service.get_workspace_by_id(workspace.id).is_active is False
+        assert workspace_service.get_workspaces_for_employee(1) == []
+    
     def test_import_workspace_overwrite(self, workspace_service):
         """Test importing with overwrite"""
         # Create existing workspace
@@ -485,6 +591,55 @@ class TestDataIsolation:
         
         assert len(records) == 3
     
+    def test_get_workspace_records_columns(self, workspace_service):
+        """Test projecting selected record columns"""
+        workspace = workspace_service.create_workspace(1, "Columns WS")
+        workspace_service.create_workspace_record(workspace.id, 1, 1, {'index': 1})
+        
+        records = workspace_service.get_workspace_records(workspace.id, columns=['id', 'status'])
+        
+        assert set(records[0]) == {'id', 'status'}
+        
+        with pytest.raises(ValueError):
+            workspace_service.get_workspace_records(workspace.id, columns=['id; DROP TABLE x'])
+    
+    def test_iter_workspace_records_releases_connections(self, workspace_service):
+        """Test partially consumed iterators do not hold pooled connections"""
+        workspace = workspace_service.create_workspace(1, "Stream WS")
+        for i in range(5):
+            workspace_service.create_workspace_record(workspace.id, 1, 1, {'index': i})
+        
+        records = workspace_service.iter_workspace_records(workspace.id, batch_size=2)
+        other_records = workspace_service.iter_workspace_records(workspace.id, batch_size=2)
+        next(records)
+        next(other_records)
+        
+        # The pool has two connections; neither iterator may still hold one
+        workspace_service.create_workspace(1, "Other WS")
+        
+        streamed = list(workspace_service.iter_workspace_records(
+            workspace.id, columns=['record_data'], batch_size=2
+        ))
+        assert len(streamed) == 5
+        assert set(streamed[0]) == {'record_data'}
+        assert len({r['record_data'] for r in streamed}) == 5
+    
+    def test_get_workspace_record_stats(self, workspace_service, db_manager):
+        """Test per-status record counts for a workspace"""
+        workspace = workspace_service.create_workspace(1, "Stats WS")
+        assert workspace_service.get_workspace_record_stats(workspace.id) == {
+            'active': 0, 'archived': 0, 'deleted': 0, 'total': 0
+        }
+        
+        workspace_service.create_workspace_records_bulk(workspace.id, 1, 1, [{'i': i} for i in range(3)])
+        db_manager.execute_update(
+            "UPDATE business_records SET status = 'archived' WHERE id = (SELECT MIN(id) FROM business_records)"
+        )
+        
+        assert workspace_service.get_workspace_record_stats(workspace.id) == {
+            'active': 2, 'archived': 1, 'deleted': 0, 'total': 3
+        }
+    
     def test_workspace_record_isolation(self, workspace_service):
         """Test that records are isolated between workspaces"""
         ws1 = workspace_service.create_workspace(1, "WS 1")
@@ -510,6 +665,21 @@ class TestDataIsolation:
         assert len(ws1_records) == 2
         assert len(ws2_records) == 1
     
+    def test_create_workspace_records_bulk(self, workspace_service):
+        """Test creating several records in one batch"""
+        workspace = workspace_service.create_workspace(1, "Bulk WS")
+        
+        created = workspace_service.create_workspace_records_bulk(
+            workspace.id, 1, 1, [{'index': i} for i in range(5)]
+        )
+        
+        assert created == 5
+        records = workspace_service.get_workspace_records(workspace.id)
+        assert sorted(json.loads(r['record_data'])['index'] for r in records) == [0, 1, 2, 3, 4]
+        
+        with pytest.raises(ValueError, match="không tồn tại"):
+            workspace_service.create_workspace_records_bulk(9999, 1, 1, [{'data': 'test'}])
+    
     def test_create_record_wrong_employee(self, workspace_service, db_manager):
         """Test creating record in workspace of different employee"""
         # Create second employee